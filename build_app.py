@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
-"""Build script for creating the macOS application bundle."""
+"""Build script for creating the macOS application bundle.
+
+Dependencies are installed with ``uv pip`` when uv is on the PATH (much faster
+on a cold environment), falling back to a single ``pip install`` otherwise.
+Pass ``--clean`` to rebuild PyInstaller's analysis cache and ``--dmg`` to also
+create a DMG installer.
+"""
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
-def build_mac_app():
-    """Build the macOS .app bundle using PyInstaller."""
+def build_mac_app(clean: bool = False):
+    """Build the macOS .app bundle using PyInstaller.
+
+    :param clean: Whether to clear PyInstaller's analysis cache before building.
+    """
 
     # Get the project root
     project_root = Path(__file__).parent
@@ -21,8 +31,12 @@ def build_mac_app():
 
     # Install dependencies if needed
     print("\n1. Installing dependencies...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "-e", ".", "-q"])
-    subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller", "-q"])
+    # Single invocation so the resolver downloads everything in one pass
+    uv = shutil.which("uv")
+    if uv:
+        subprocess.run([uv, "pip", "install", "--python", sys.executable, "-e", ".", "pyinstaller", "-q"])
+    else:
+        subprocess.run([sys.executable, "-m", "pip", "install", "-e", ".", "pyinstaller", "-q"])
 
     print("\n2. Creating application bundle...")
 
@@ -32,8 +46,10 @@ def build_mac_app():
         "--name", "Virtual Manuscript Reviewer",
         "--windowed",  # No console window
         "--onedir",  # Create a directory bundle (faster startup than onefile)
+        "--noarchive",  # Ship .pyc files loose instead of in the PYZ archive (faster imports)
+        "--strip",  # Strip symbols from bundled binaries (smaller dylibs)
+        "--optimize", "2",  # Bytecode as with python -OO (no docstrings or asserts)
         "--noconfirm",  # Overwrite without asking
-        "--clean",  # Clean cache
 
         # Icon (we'll create a simple one)
         # "--icon", "icon.icns",
@@ -49,17 +65,21 @@ def build_mac_app():
         "--exclude-module", "sphinx",
         "--exclude-module", "pytest",
 
+        # Exclude stdlib/tooling modules the app never uses at runtime
+        "--exclude-module", "unittest",
+        "--exclude-module", "doctest",
+        "--exclude-module", "pydoc",
+        "--exclude-module", "xmlrpc",
+        "--exclude-module", "distutils",
+        "--exclude-module", "setuptools",
+        "--exclude-module", "pip",
+        "--exclude-module", "scipy",
+        "--exclude-module", "pandas",
+
         # Hidden imports that PyInstaller might miss
         "--hidden-import", "tiktoken_ext.openai_public",
         "--hidden-import", "tiktoken_ext",
         "--hidden-import", "PyQt6.sip",
-        "--hidden-import", "reportlab.graphics.barcode.common",
-        "--hidden-import", "reportlab.graphics.barcode.code39",
-        "--hidden-import", "reportlab.graphics.barcode.code93",
-        "--hidden-import", "reportlab.graphics.barcode.code128",
-        "--hidden-import", "reportlab.graphics.barcode.usps",
-        "--hidden-import", "reportlab.graphics.barcode.usps4s",
-        "--hidden-import", "reportlab.graphics.barcode.ecc200datamatrix",
 
         # Collect all data files
         "--collect-data", "tiktoken",
@@ -69,6 +89,10 @@ def build_mac_app():
         "src/virtual_manuscript_reviewer/gui.py",
     ]
 
+    # Reuse the analysis cache unless a clean build is requested
+    if clean:
+        cmd.insert(-1, "--clean")
+
     result = subprocess.run(cmd)
 
     if result.returncode != 0:
@@ -79,15 +103,17 @@ def build_mac_app():
     app_path = project_root / "dist" / "Virtual Manuscript Reviewer.app"
 
     if app_path.exists():
-        print("\n" + "=" * 50)
-        print("✅ Build successful!")
-        print(f"\n📍 App location: {app_path}")
-        print("\nTo install:")
-        print("  1. Open 'dist' folder")
-        print("  2. Drag 'Virtual Manuscript Reviewer.app' to Applications")
-        print("\n⚠️  Before running, set your OpenAI API key:")
-        print("  export OPENAI_API_KEY='your-key-here'")
-        print("\nOr add it to ~/.zshrc for permanent access.")
+        print("\n".join([
+            "\n" + "=" * 50,
+            "✅ Build successful!",
+            f"\n📍 App location: {app_path}",
+            "\nTo install:",
+            "  1. Open 'dist' folder",
+            "  2. Drag 'Virtual Manuscript Reviewer.app' to Applications",
+            "\n⚠️  Before running, set your OpenAI API key:",
+            "  export OPENAI_API_KEY='your-key-here'",
+            "\nOr add it to ~/.zshrc for permanent access.",
+        ]))
         return True
     else:
         print("\n❌ App bundle not found!")
@@ -117,7 +143,7 @@ def create_dmg():
 
 
 if __name__ == "__main__":
-    if build_mac_app():
+    if build_mac_app(clean="--clean" in sys.argv):
         # Optionally create DMG
         if "--dmg" in sys.argv:
             create_dmg()
@@ -1,7 +1,61 @@
 """Virtual Manuscript Reviewer - AI-powered peer review for scientific manuscripts."""
 
-from virtual_manuscript_reviewer.agent import Agent
-from virtual_manuscript_reviewer.manuscript import Manuscript
-from virtual_manuscript_reviewer.run_review import run_review
+from __future__ import annotations
 
-__all__ = ["Agent", "Manuscript", "run_review"]
+import sys
+import types
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from virtual_manuscript_reviewer.agent import Agent
+    from virtual_manuscript_reviewer.manuscript import Manuscript
+    from virtual_manuscript_reviewer.run_review import arun_review, run_review
+
+__all__ = ["Agent", "Manuscript", "arun_review", "run_review"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily imports the public API so importing the package or its CLI stays cheap.
+
+    :param name: The attribute name.
+    :return: The requested attribute.
+    """
+    if name == "Agent":
+        from virtual_manuscript_reviewer.agent import Agent as value
+    elif name == "Manuscript":
+        from virtual_manuscript_reviewer.manuscript import Manuscript as value
+    elif name == "arun_review":
+        from virtual_manuscript_reviewer.run_review import arun_review as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+class _Package(types.ModuleType):
+    """The package module, with run_review resolved on every access.
+
+    Importing the run_review submodule makes the import system set the package's
+    run_review attribute to that module, after the module has run, so neither a
+    cached global nor __getattr__ could keep it the function. A property on the
+    module's class takes precedence over that assignment.
+    """
+
+    @property
+    def run_review(self) -> Callable[..., str | None]:
+        if "run_review" in vars(self):
+            return vars(self)["run_review"]
+
+        from virtual_manuscript_reviewer.run_review import run_review
+
+        return run_review
+
+    @run_review.setter
+    def run_review(self, value: Any) -> None:
+        # Ignore the import system binding the submodule, but allow replacing the function
+        if not isinstance(value, types.ModuleType):
+            vars(self)["run_review"] = value
+
+
+sys.modules[__name__].__class__ = _Package
@@ -52,6 +52,10 @@ class Agent:
 
     def __eq__(self, other: object) -> bool:
         """Checks if the agent is equal to another agent."""
+        # Agents are usually compared with themselves (the same preset or panel object)
+        if self is other:
+            return True
+
         if not isinstance(other, Agent):
             return False
 
@@ -5,11 +5,6 @@ from typing import Optional
 
 from tap import Tap
 
-from virtual_manuscript_reviewer.manuscript import Manuscript
-from virtual_manuscript_reviewer.run_review import run_review, review_manuscript
-from virtual_manuscript_reviewer.revision_tracker import RevisionTracker
-from virtual_manuscript_reviewer.prompts import BIOMEDICAL_REVIEW_CRITERIA
-
 
 class ReviewArgs(Tap):
     """Arguments for manuscript review."""
@@ -39,16 +34,26 @@ def main() -> None:
         print(f"Error: File not found: {pdf_path}")
         return
 
+    # Import here so --help and argument errors don't load the review stack
+    from virtual_manuscript_reviewer.manuscript import Manuscript
+    from virtual_manuscript_reviewer.run_review import run_review
+    from virtual_manuscript_reviewer.revision_tracker import RevisionTracker
+    from virtual_manuscript_reviewer.prompts import BIOMEDICAL_REVIEW_CRITERIA
+
     print(f"Loading manuscript from: {pdf_path}")
     manuscript = Manuscript.from_pdf(pdf_path)
-    print(f"Title: {manuscript.title}")
-    print(f"Version hash: {manuscript.version_hash}")
-    print(f"Pages: {manuscript.metadata.get('page_count', 'unknown')}")
-    print()
+    print("\n".join([
+        f"Title: {manuscript.title}",
+        f"Version hash: {manuscript.version_hash}",
+        f"Pages: {manuscript.metadata.get('page_count', 'unknown')}",
+        "",
+    ]))
 
     # Handle revision tracking if project_dir is specified
     previous_reviews: tuple[str, ...] = ()
     author_response = ""
+    tracker: Optional[RevisionTracker] = None
+    version = None
 
     if args.project_dir:
         tracker = RevisionTracker(Path(args.project_dir))
@@ -57,8 +62,7 @@ def main() -> None:
         if args.author_response:
             response_path = Path(args.author_response)
             if response_path.exists():
-                with open(response_path, "r") as f:
-                    author_response = f.read()
+                author_response = response_path.read_text(encoding="utf-8")
                 print(f"Loaded author response from: {response_path}")
 
         # Add this version to tracker
@@ -81,19 +85,19 @@ def main() -> None:
         if args.author_response:
             response_path = Path(args.author_response)
             if response_path.exists():
-                with open(response_path, "r") as f:
-                    author_response = f.read()
+                author_response = response_path.read_text(encoding="utf-8")
 
     # Generate save name
-    safe_title = "".join(c if c.isalnum() or c in "- " else "_" for c in manuscript.title[:50])
-    save_name = f"{safe_title}_{manuscript.version_hash}"
+    save_name = manuscript.safe_save_name
 
-    print(f"\nStarting {args.review_type} review...")
-    print(f"Discussion rounds: {args.num_rounds}")
-    print(f"PubMed search: {'disabled' if args.no_pubmed else 'enabled'}")
-    print(f"PDF output: {'disabled' if args.no_pdf else 'enabled'}")
-    print(f"Scientific mentor: {'disabled' if args.no_mentor else 'enabled'}")
-    print()
+    print("\n".join([
+        f"\nStarting {args.review_type} review...",
+        f"Discussion rounds: {args.num_rounds}",
+        f"PubMed search: {'disabled' if args.no_pubmed else 'enabled'}",
+        f"PDF output: {'disabled' if args.no_pdf else 'enabled'}",
+        f"Scientific mentor: {'disabled' if args.no_mentor else 'enabled'}",
+        "",
+    ]))
 
     # Run review
     summary = run_review(
@@ -112,10 +116,8 @@ def main() -> None:
         run_mentor=not args.no_mentor,
     )
 
-    # Update tracker with review
-    if args.project_dir and summary:
-        tracker = RevisionTracker(Path(args.project_dir))
-        version = tracker.get_latest_version()
+    # Update tracker with review (reusing the tracker and version from above)
+    if tracker is not None and summary:
         if version:
             review_path = Path(args.output_dir) / f"{save_name}.json"
             tracker.add_review(
@@ -1,32 +1,26 @@
 """Holds constants for the manuscript reviewer."""
 
+from types import MappingProxyType
+from typing import Mapping
+
 # Use OpenAI's most capable model
 DEFAULT_MODEL = "gpt-5.2-2025-12-11"
 
-# Prices in USD (https://openai.com/api/pricing/)
-MODEL_TO_INPUT_PRICE_PER_TOKEN = {
-    "gpt-3.5-turbo-0125": 0.5 / 10**6,
-    "gpt-4o-2024-08-06": 2.5 / 10**6,
-    "gpt-4o-2024-05-13": 5 / 10**6,
-    "gpt-4o-mini-2024-07-18": 0.15 / 10**6,
-    "gpt-4o": 2.5 / 10**6,
-    "gpt-4o-mini": 0.15 / 10**6,
-    "o1-mini-2024-09-12": 3 / 10**6,
-    "gpt-4.5-preview": 75 / 10**6,  # GPT-4.5/GPT-5 series
-    "gpt-4.5-preview-2025-02-27": 75 / 10**6,
-}
+# Cheaper model for condensing the earlier rounds of long review discussions
+SUMMARY_MODEL = "gpt-4o-mini"
 
-MODEL_TO_OUTPUT_PRICE_PER_TOKEN = {
-    "gpt-3.5-turbo-0125": 1.5 / 10**6,
-    "gpt-4o-2024-08-06": 10 / 10**6,
-    "gpt-4o-2024-05-13": 15 / 10**6,
-    "gpt-4o-mini-2024-07-18": 0.6 / 10**6,
-    "gpt-4o": 10 / 10**6,
-    "gpt-4o-mini": 0.6 / 10**6,
-    "o1-mini-2024-09-12": 12 / 10**6,
-    "gpt-4.5-preview": 150 / 10**6,  # GPT-4.5/GPT-5 series
-    "gpt-4.5-preview-2025-02-27": 150 / 10**6,
-}
+# Prices in USD per token as (input, output) (https://openai.com/api/pricing/)
+MODEL_TO_PRICE_PER_TOKEN: Mapping[str, tuple[float, float]] = MappingProxyType({
+    "gpt-3.5-turbo-0125": (0.5e-6, 1.5e-6),
+    "gpt-4o-2024-08-06": (2.5e-6, 10e-6),
+    "gpt-4o-2024-05-13": (5e-6, 15e-6),
+    "gpt-4o-mini-2024-07-18": (0.15e-6, 0.6e-6),
+    "gpt-4o": (2.5e-6, 10e-6),
+    "gpt-4o-mini": (0.15e-6, 0.6e-6),
+    "o1-mini-2024-09-12": (3e-6, 12e-6),
+    "gpt-4.5-preview": (75e-6, 150e-6),  # GPT-4.5/GPT-5 series
+    "gpt-4.5-preview-2025-02-27": (75e-6, 150e-6),
+})
 
 # Temperature settings
 CONSISTENT_TEMPERATURE = 0.2
@@ -55,8 +49,12 @@ PUBMED_TOOL_DESCRIPTION = {
                     "description": "Whether to return only the abstract of the articles.",
                 },
             },
-            "required": ["query", "num_articles"],
+            # Strict tools must list every property as required
+            "required": ["query", "num_articles", "abstract_only"],
+            "additionalProperties": False,
         },
+        # chat.completions.stream only accepts strict function tools
+        "strict": True,
     },
 }
 
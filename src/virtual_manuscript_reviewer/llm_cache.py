@@ -0,0 +1,74 @@
+"""On-disk cache for LLM responses that are deterministic enough to reuse."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Keys are only compared within this machine's cache, so use the faster blake3 when
+# it is installed; switching hash just means a cold cache. (Manuscript.version_hash
+# is stored in project files and must stay SHA-256.)
+try:
+    from blake3 import blake3 as _key_hash
+except ImportError:
+    from hashlib import sha256 as _key_hash
+
+# Where cached responses are stored, one JSON file per key
+CACHE_DIR = Path.home() / ".cache" / "virtual_manuscript_reviewer"
+
+# How long a cached response stays valid (7 days)
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a content-addressed cache key from the inputs of an LLM call.
+
+    :param parts: The values that determine the response (prompt version, model, text, ...).
+    :return: The hex digest of the parts.
+    """
+    return _key_hash("|".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def check_cache(key: str, cache_dir: Path = CACHE_DIR) -> Optional[Any]:
+    """Return the cached data for a key, if present and not expired.
+
+    :param key: The cache key.
+    :param cache_dir: The cache directory.
+    :return: The cached data or None.
+    """
+    cache_file = cache_dir / f"{key}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if entry.get("expires_at", 0) < time.time():
+        return None
+
+    return entry.get("data")
+
+
+def save_cache(
+    key: str,
+    data: Any,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    cache_dir: Path = CACHE_DIR,
+) -> None:
+    """Store data under a key. Failures are ignored; the cache is only an optimization.
+
+    :param key: The cache key.
+    :param data: JSON-serializable data to cache.
+    :param ttl_seconds: How long the entry stays valid.
+    :param cache_dir: The cache directory.
+    """
+    now = time.time()
+    entry = {"created_at": now, "expires_at": now + ttl_seconds, "data": data}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+    except OSError:
+        pass
@@ -3,17 +3,70 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List, Dict
 import hashlib
+import io
+import json
+import re
 
 import fitz  # PyMuPDF
 
+# Characters that are not safe in generated file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\- ]")
+
+# Appended to review context that was cut to fit max_length
+_TRUNCATION_NOTE = "\n\n[Text truncated due to length...]"
+
+# Characters encoded per hash update when hashing raw manuscript text
+_HASH_CHUNK_CHARS = 65536
+
+# Bytes read per hash update when hashing a PDF file for the parse cache
+_FILE_CHUNK_BYTES = 1 << 20
+
+# Bump whenever PDF extraction changes so cached parses are invalidated
+_PARSE_CACHE_VERSION = 1
+
+# Abstract markers, tried in order, and the markers that end an abstract
+_ABSTRACT_MARKERS = ("abstract", "summary")
+_ABSTRACT_MARKER_RES = tuple(re.compile(rf"\b{marker}\b", re.IGNORECASE) for marker in _ABSTRACT_MARKERS)
+_ABSTRACT_END_RE = re.compile(r"\b(?:introduction|keywords|background)\b|^\s*1[.\s]", re.IGNORECASE | re.MULTILINE)
+
+# Common section headers in biomedical papers
+_SECTION_HEADINGS = (
+    "abstract",
+    "introduction",
+    "background",
+    "methods",
+    "materials and methods",
+    "results",
+    "discussion",
+    "conclusion",
+    "conclusions",
+    "references",
+    "acknowledgements",
+    "acknowledgments",
+    "supplementary",
+    "figures",
+    "tables",
+)
+
+# A heading at the start of a line (after \n or a bare \r); longest alternatives
+# first so "conclusions" wins over "conclusion"
+_SECTION_RE = re.compile(
+    r"(?:^|(?<=\r))(" + "|".join(re.escape(h) for h in sorted(_SECTION_HEADINGS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 @dataclass
 class ManuscriptSection:
     """A section of a manuscript."""
 
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("title", "content", "page_start", "page_end")
+
     title: str
     content: str
     page_start: int
@@ -33,10 +86,12 @@ class Manuscript:
     metadata: Dict = field(default_factory=dict)
 
     @classmethod
-    def from_pdf(cls, pdf_path: Path | str) -> "Manuscript":
+    def from_pdf(cls, pdf_path: Path | str, cache_dir: Path | str | None = None) -> "Manuscript":
         """Extract manuscript content from a PDF file.
 
         :param pdf_path: Path to the PDF file.
+        :param cache_dir: Directory of cached parses keyed by file content; when given, a
+            byte-identical PDF parsed before is loaded from there instead of re-extracted.
         :return: A Manuscript object with extracted content.
         """
         pdf_path = Path(pdf_path)
@@ -47,20 +102,39 @@ class Manuscript:
         if not pdf_path.suffix.lower() == ".pdf":
             raise ValueError(f"File is not a PDF: {pdf_path}")
 
+        # Reuse an earlier parse of the same file
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = Path(cache_dir) / f"{cls._file_digest(pdf_path)}.json"
+            manuscript = cls._load_cached_parse(cache_file)
+            if manuscript is not None:
+                manuscript.source_path = pdf_path
+                return manuscript
+
         # Open the PDF
         doc = fitz.open(pdf_path)
 
-        # Extract full text from all pages
-        full_text_parts = []
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+        # Extract full text from all pages, hashing as we go so the text is only
+        # scanned once (same result as hashing "\n\n".join(pages)).
+        # This stays serial: PyMuPDF is not thread-safe, and for manuscript-sized
+        # PDFs a process pool costs more to start than the extraction itself.
+        text_buffer = io.StringIO()
+        text_hash = hashlib.sha256()
+        first_page_text = ""
+        for page_num, page in enumerate(doc):
             text = page.get_text()
-            full_text_parts.append(text)
+            if page_num == 0:
+                first_page_text = text
+            else:
+                text_buffer.write("\n\n")
+                text_hash.update(b"\n\n")
+            text_buffer.write(text)
+            text_hash.update(text.encode())
 
-        full_text = "\n\n".join(full_text_parts)
+        full_text = text_buffer.getvalue()
 
         # Try to extract title (usually first large text on first page)
-        title = cls._extract_title(doc)
+        title = cls._extract_title(doc, first_page_text)
 
         # Try to extract abstract
         abstract = cls._extract_abstract(full_text)
@@ -68,16 +142,17 @@ class Manuscript:
         # Try to identify sections
         sections = cls._extract_sections(full_text, doc)
 
-        # Extract metadata
-        metadata = dict(doc.metadata) if doc.metadata else {}
+        # Extract metadata, keeping only the fields the PDF actually sets
+        pdf_metadata = doc.metadata
+        metadata = {key: value for key, value in pdf_metadata.items() if value} if pdf_metadata else {}
         metadata["page_count"] = len(doc)
 
-        # Compute version hash for revision tracking
-        version_hash = hashlib.sha256(full_text.encode()).hexdigest()[:16]
+        # Version hash for revision tracking
+        version_hash = text_hash.hexdigest()[:16]
 
         doc.close()
 
-        return cls(
+        manuscript = cls(
             title=title,
             abstract=abstract,
             full_text=full_text,
@@ -87,6 +162,11 @@ class Manuscript:
             metadata=metadata,
         )
 
+        if cache_file is not None:
+            manuscript._save_cached_parse(cache_file)
+
+        return manuscript
+
     @classmethod
     def from_text(cls, text: str, title: str = "Untitled Manuscript") -> "Manuscript":
         """Create a manuscript from raw text.
@@ -96,7 +176,13 @@ class Manuscript:
         :return: A Manuscript object.
         """
         abstract = cls._extract_abstract(text)
-        version_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+
+        # Hash in chunks so the whole text is never encoded at once
+        # (same digest as hashing text.encode())
+        text_hash = hashlib.sha256()
+        for start in range(0, len(text), _HASH_CHUNK_CHARS):
+            text_hash.update(text[start:start + _HASH_CHUNK_CHARS].encode())
+        version_hash = text_hash.hexdigest()[:16]
 
         return cls(
             title=title,
@@ -108,11 +194,91 @@ class Manuscript:
             metadata={},
         )
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization.
+
+        :return: Dictionary representation (without the source path).
+        """
+        return {
+            "title": self.title,
+            "abstract": self.abstract,
+            "full_text": self.full_text,
+            "sections": [
+                {
+                    "title": section.title,
+                    "content": section.content,
+                    "page_start": section.page_start,
+                    "page_end": section.page_end,
+                }
+                for section in self.sections
+            ],
+            "version_hash": self.version_hash,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Manuscript":
+        """Recreate a manuscript from its serialized form.
+
+        :param data: Dictionary produced by to_dict.
+        :return: The Manuscript.
+        """
+        return cls(
+            title=data["title"],
+            abstract=data["abstract"],
+            full_text=data["full_text"],
+            sections=[ManuscriptSection(**section) for section in data["sections"]],
+            version_hash=data["version_hash"],
+            metadata=data["metadata"],
+        )
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Hash a file's contents in chunks.
+
+        :param path: The file to hash.
+        :return: The hex digest.
+        """
+        file_hash = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_FILE_CHUNK_BYTES), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    @classmethod
+    def _load_cached_parse(cls, cache_file: Path) -> Optional["Manuscript"]:
+        """Load a cached parse, if present and written by this extraction version.
+
+        :param cache_file: The cache file.
+        :return: The Manuscript or None.
+        """
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _PARSE_CACHE_VERSION:
+                return None
+            return cls.from_dict(data["manuscript"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_cached_parse(self, cache_file: Path) -> None:
+        """Store this parse. Failures are ignored; the cache is only an optimization.
+
+        :param cache_file: The cache file.
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump({"version": _PARSE_CACHE_VERSION, "manuscript": self.to_dict()}, f)
+        except OSError:
+            pass
+
     @staticmethod
-    def _extract_title(doc: fitz.Document) -> str:
+    def _extract_title(doc: fitz.Document, first_page_text: str) -> str:
         """Extract the title from the PDF document.
 
         :param doc: The PyMuPDF document.
+        :param first_page_text: The already-extracted text of the first page.
         :return: The extracted title or a default.
         """
         # Try metadata first
@@ -120,10 +286,8 @@ class Manuscript:
             return doc.metadata["title"]
 
         # Try to get first line of first page (often the title)
-        if len(doc) > 0:
-            first_page = doc[0]
-            text = first_page.get_text()
-            lines = [line.strip() for line in text.split("\n") if line.strip()]
+        if first_page_text:
+            lines = [line.strip() for line in first_page_text.splitlines() if line.strip()]
             if lines:
                 # Title is usually one of the first non-empty lines
                 # and is typically short (less than 200 chars)
@@ -140,31 +304,22 @@ class Manuscript:
         :param text: The full manuscript text.
         :return: The extracted abstract or empty string.
         """
-        text_lower = text.lower()
-
-        # Look for common abstract markers
-        abstract_markers = ["abstract", "summary"]
-        end_markers = ["introduction", "keywords", "background", "1.", "1 "]
-
-        for marker in abstract_markers:
-            start_idx = text_lower.find(marker)
-            if start_idx != -1:
+        # Case-insensitive regex search avoids a lowercased copy of the whole text
+        for marker_re in _ABSTRACT_MARKER_RES:
+            marker_match = marker_re.search(text)
+            if marker_match:
                 # Find where abstract ends
-                search_start = start_idx + len(marker)
-                end_idx = len(text)
-
-                for end_marker in end_markers:
-                    idx = text_lower.find(end_marker, search_start)
-                    if idx != -1 and idx < end_idx:
-                        end_idx = idx
+                start_idx = marker_match.start()
+                end_match = _ABSTRACT_END_RE.search(text, marker_match.end())
+                end_idx = end_match.start() if end_match else len(text)
 
                 # Extract abstract text
                 abstract = text[start_idx:end_idx].strip()
 
                 # Clean up: remove the "Abstract" header itself
-                lines = abstract.split("\n")
-                if lines and lines[0].lower().strip() in abstract_markers:
-                    abstract = "\n".join(lines[1:]).strip()
+                first_line, _, rest = abstract.partition("\n")
+                if first_line.lower().strip() in _ABSTRACT_MARKERS:
+                    abstract = rest.strip()
 
                 # Limit length
                 if len(abstract) > 100:  # Minimum reasonable abstract length
@@ -182,55 +337,19 @@ class Manuscript:
         """
         sections = []
 
-        # Common section headers in biomedical papers
-        section_patterns = [
-            "abstract",
-            "introduction",
-            "background",
-            "methods",
-            "materials and methods",
-            "results",
-            "discussion",
-            "conclusion",
-            "conclusions",
-            "references",
-            "acknowledgements",
-            "acknowledgments",
-            "supplementary",
-            "figures",
-            "tables",
+        # Find section positions in a single pass (matches come back in order)
+        found_sections = [
+            (match.start(), match.group(1).title())
+            for match in _SECTION_RE.finditer(text)
         ]
 
-        text_lower = text.lower()
-        found_sections = []
-
-        # Find section positions
-        for pattern in section_patterns:
-            # Look for pattern at start of line or after newline
-            search_pos = 0
-            while True:
-                idx = text_lower.find(pattern, search_pos)
-                if idx == -1:
-                    break
-
-                # Check if it's at start of line
-                if idx == 0 or text[idx - 1] in "\n\r":
-                    found_sections.append((idx, pattern.title()))
-
-                search_pos = idx + 1
-
-        # Sort by position
-        found_sections.sort(key=lambda x: x[0])
-
         # Create section objects
         for i, (start_idx, section_title) in enumerate(found_sections):
             end_idx = found_sections[i + 1][0] if i + 1 < len(found_sections) else len(text)
-            content = text[start_idx:end_idx].strip()
 
-            # Remove the section header from content
-            lines = content.split("\n")
-            if lines:
-                content = "\n".join(lines[1:]).strip()
+            # Content starts after the header line; a header with no line after it is empty
+            header_end = text.find("\n", start_idx, end_idx)
+            content = text[header_end + 1:end_idx].strip() if header_end != -1 else ""
 
             sections.append(ManuscriptSection(
                 title=section_title,
@@ -241,28 +360,41 @@ class Manuscript:
 
         return sections
 
+    @cached_property
+    def safe_save_name(self) -> str:
+        """Returns a filesystem-safe name for saving reviews of this manuscript version.
+
+        :return: The sanitized title (first 50 chars) followed by the version hash.
+        """
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("_", self.title[:50])
+        return f"{safe_title}_{self.version_hash}"
+
     def get_review_context(self, max_length: int = 50000) -> str:
         """Get the manuscript content formatted for review.
 
         :param max_length: Maximum character length to return.
         :return: Formatted manuscript text for review.
         """
-        parts = [
+        header = "\n".join([
             f"# {self.title}",
             "",
             "## Abstract",
             self.abstract if self.abstract else "(No abstract found)",
             "",
             "## Full Text",
-            self.full_text[:max_length - len(self.title) - len(self.abstract) - 100],
-        ]
+            "",
+        ])
+
+        # Whatever the header leaves of max_length goes to the full text
+        budget = max_length - len(header)
 
-        result = "\n".join(parts)
+        if len(self.full_text) <= budget:
+            return header + self.full_text
 
-        if len(result) > max_length:
-            result = result[:max_length] + "\n\n[Text truncated due to length...]"
+        if budget <= 0:
+            return header[:max_length] + _TRUNCATION_NOTE
 
-        return result
+        return header + self.full_text[:budget] + _TRUNCATION_NOTE
 
     def __str__(self) -> str:
         """String representation of the manuscript."""
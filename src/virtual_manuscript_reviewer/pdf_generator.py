@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -16,17 +16,44 @@ from reportlab.platypus import (
     Paragraph,
     Spacer,
     PageBreak,
-    Table,
-    TableStyle,
-    ListFlowable,
-    ListItem,
 )
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 
 
+# Line-kind classifier for the per-line conversion loop; the named group that
+# matches identifies the kind, and the text after the match is the content
+_LINE_RE = re.compile(
+    r'(?P<h4>#### )|(?P<h3>### )|(?P<h2>## )|(?P<h1># )'
+    r'|(?P<num>\d+)\.\s|(?P<bullet>[-*] )'
+)
+
+_HEADER_STYLES = {
+    'h4': 'SubSubsectionHeader',
+    'h3': 'SubsectionHeader',
+    'h2': 'SectionHeader',
+    'h1': 'DocTitle',
+}
+
+# Inline formatting in one alternation; group order sets precedence (bold italic, then bold,
+# italic and code). Single markers must not be half of a doubled one, so an italic span
+# can contain bold (*a **b** c*) without ending at the first '**'
+_INLINE_RE = re.compile(
+    r'\*\*\*(.+?)\*\*\*|___(.+?)___'
+    r'|\*\*(.+?)\*\*|__(.+?)__'
+    r'|(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)|(?<!_)_(?!_)(.+?)(?<!_)_(?!_)'
+    r'|`(.+?)`'
+)
+
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+@lru_cache(maxsize=1)
 def _create_styles() -> dict:
     """Create custom paragraph styles for PDF generation.
 
+    The stylesheet is built once and shared; ReportLab only reads paragraph
+    styles while building a document, so callers must not modify it.
+
     :return: Dictionary of paragraph styles.
     """
     styles = getSampleStyleSheet()
@@ -159,48 +186,41 @@ def _markdown_to_flowables(text: str, styles: dict) -> list:
     :return: List of flowables.
     """
     flowables = []
-    lines = text.split('\n')
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    # Resolve styles once rather than per line
+    header_styles = {kind: styles[name] for kind, name in _HEADER_STYLES.items()}
+    numbered_style = styles['NumberedText']
+    bullet_style = styles['BulletText']
+    body_style = styles['ReviewBodyText']
+
+    for line in text.splitlines():
+        line = line.strip()
 
         if not line:
             flowables.append(Spacer(1, 6))
-            i += 1
             continue
 
+        match = _LINE_RE.match(line)
+        kind = match.lastgroup if match else None
+
         # Headers
-        if line.startswith('#### '):
-            flowables.append(Paragraph(line[5:], styles['SubSubsectionHeader']))
-        elif line.startswith('### '):
-            flowables.append(Paragraph(line[4:], styles['SubsectionHeader']))
-        elif line.startswith('## '):
-            flowables.append(Paragraph(line[3:], styles['SectionHeader']))
-        elif line.startswith('# '):
-            flowables.append(Paragraph(line[2:], styles['DocTitle']))
+        if kind in header_styles:
+            flowables.append(Paragraph(line[match.end():], header_styles[kind]))
         # Numbered list items
-        elif re.match(r'^\d+\.\s', line):
-            # Extract the text after the number
-            match = re.match(r'^(\d+)\.\s(.+)$', line)
-            if match:
-                num, content = match.groups()
-                content = _escape_html(content)
-                content = _apply_inline_formatting(content)
-                flowables.append(Paragraph(f"{num}. {content}", styles['NumberedText']))
+        elif kind == 'num':
+            content = _escape_html(line[match.end():])
+            content = _apply_inline_formatting(content)
+            flowables.append(Paragraph(f"{match.group('num')}. {content}", numbered_style))
         # Bullet points
-        elif line.startswith('- ') or line.startswith('* '):
-            content = line[2:]
-            content = _escape_html(content)
+        elif kind == 'bullet':
+            content = _escape_html(line[match.end():])
             content = _apply_inline_formatting(content)
-            flowables.append(Paragraph(f"• {content}", styles['BulletText']))
+            flowables.append(Paragraph(f"• {content}", bullet_style))
         # Regular paragraph
         else:
             content = _escape_html(line)
             content = _apply_inline_formatting(content)
-            flowables.append(Paragraph(content, styles['ReviewBodyText']))
-
-        i += 1
+            flowables.append(Paragraph(content, body_style))
 
     return flowables
 
@@ -211,10 +231,7 @@ def _escape_html(text: str) -> str:
     :param text: The text to escape.
     :return: Escaped text.
     """
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    return text
+    return text.translate(_HTML_ESCAPE_TABLE)
 
 
 def _apply_inline_formatting(text: str) -> str:
@@ -223,18 +240,35 @@ def _apply_inline_formatting(text: str) -> str:
     :param text: The text with markdown formatting.
     :return: Text with ReportLab formatting tags.
     """
-    # Bold: **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
+    # Most lines carry no markup; skip the regex scan for them
+    if '*' not in text and '_' not in text and '`' not in text:
+        return text
 
-    # Italic: *text* or _text_
-    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-    text = re.sub(r'_(.+?)_', r'<i>\1</i>', text)
+    return _INLINE_RE.sub(_inline_replacement, text)
 
-    # Code: `text`
-    text = re.sub(r'`(.+?)`', r'<font face="Courier">\1</font>', text)
 
-    return text
+def _inline_replacement(match: re.Match) -> str:
+    """Convert one inline markdown match to ReportLab tags.
+
+    :param match: A match of the inline formatting pattern.
+    :return: The tagged text.
+    """
+    content = match.group(match.lastindex)
+
+    # Bold italic: ***text*** or ___text___
+    if match.lastindex <= 2:
+        return f'<b><i>{_apply_inline_formatting(content)}</i></b>'
+
+    # Bold: **text** or __text__ (content may contain nested italic/code)
+    if match.lastindex <= 4:
+        return f'<b>{_apply_inline_formatting(content)}</b>'
+
+    # Italic: *text* or _text_ (content may contain nested bold/code)
+    if match.lastindex <= 6:
+        return f'<i>{_apply_inline_formatting(content)}</i>'
+
+    # Code: `text`
+    return f'<font face="Courier">{content}</font>'
 
 
 def generate_review_pdf(
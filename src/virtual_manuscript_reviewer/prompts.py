@@ -1,5 +1,7 @@
 """Prompts and pre-configured reviewer agents for manuscript review."""
 
+import io
+from functools import lru_cache
 from typing import Iterable
 
 from virtual_manuscript_reviewer.agent import Agent
@@ -83,12 +85,16 @@ def format_manuscript(manuscript_text: str, intro: str = "Here is the manuscript
     return f"{intro}\n\n[begin manuscript]\n\n{manuscript_text}\n\n[end manuscript]\n\n"
 
 
+@lru_cache(maxsize=32)
 def format_review_criteria(
     criteria: tuple[str, ...],
     intro: str = "Please evaluate the manuscript on the following criteria:",
 ) -> str:
     """Formats the review criteria for the prompt.
 
+    Cached, since the same criteria tuple is formatted for every prompt of a
+    review; the criteria must therefore be hashable (a tuple, not a list).
+
     :param criteria: The review criteria.
     :param intro: The introduction to the criteria.
     :return: The formatted criteria.
@@ -109,11 +115,15 @@ def format_previous_reviews(
     if not reviews:
         return ""
 
-    formatted = [
-        f"[begin review {i + 1}]\n\n{review}\n\n[end review {i + 1}]"
-        for i, review in enumerate(reviews)
-    ]
-    return f"{intro}\n\n{''.join(formatted)}\n\n"
+    # Write straight into one buffer instead of an f-string copy of every review
+    buffer = io.StringIO()
+    buffer.write(f"{intro}\n\n")
+    for i, review in enumerate(reviews, start=1):
+        buffer.write(f"[begin review {i}]\n\n")
+        buffer.write(review)
+        buffer.write(f"\n\n[end review {i}]")
+    buffer.write("\n\n")
+    return buffer.getvalue()
 
 
 def format_author_response(
@@ -170,6 +180,23 @@ Provide one of: Accept, Minor Revisions, Major Revisions, or Reject.
 Justify your recommendation based on the above assessment."""
 
 
+def manuscript_context_prompt(
+    manuscript_text: str,
+    review_criteria: tuple[str, ...] = (),
+) -> str:
+    """Generates the manuscript and criteria block that opens every review.
+
+    It depends only on the manuscript and criteria, so it is byte-identical across
+    all calls of a review (and across reviews of the same manuscript), which lets
+    the API serve it from its prompt cache.
+
+    :param manuscript_text: The manuscript content.
+    :param review_criteria: Specific criteria to evaluate.
+    :return: The manuscript context prompt.
+    """
+    return f"{format_manuscript(manuscript_text)}{format_review_criteria(review_criteria)}"
+
+
 # =============================================================================
 # Review Meeting Prompts
 # =============================================================================
@@ -177,8 +204,6 @@ Justify your recommendation based on the above assessment."""
 def review_meeting_start_prompt(
     editor: Agent,
     reviewers: tuple[Agent, ...],
-    manuscript_text: str,
-    review_criteria: tuple[str, ...] = (),
     previous_reviews: tuple[str, ...] = (),
     author_response: str = "",
     num_rounds: int = 1,
@@ -187,8 +212,6 @@ def review_meeting_start_prompt(
 
     :param editor: The editor leading the review.
     :param reviewers: The reviewer panel.
-    :param manuscript_text: The manuscript content.
-    :param review_criteria: Specific criteria to evaluate.
     :param previous_reviews: Previous reviews (for revision tracking).
     :param author_response: Authors' response to previous reviews.
     :param num_rounds: Number of discussion rounds.
@@ -209,8 +232,6 @@ def review_meeting_start_prompt(
         f"The review panel consists of the {editor.title} and the following reviewers: "
         f"{', '.join(reviewer.title for reviewer in reviewers)}.\n\n"
         f"{revision_context}"
-        f"{format_manuscript(manuscript_text)}"
-        f"{format_review_criteria(review_criteria)}"
         f"The {editor.title} will convene the meeting and provide initial impressions. "
         f"Then, each reviewer will provide their assessment one-by-one. "
         f"After all reviewers have given their input, the {editor.title} will {SYNTHESIS_PROMPT}. "
@@ -292,16 +313,12 @@ def review_meeting_editor_final_prompt(
 
 def individual_review_start_prompt(
     reviewer: Agent,
-    manuscript_text: str,
-    review_criteria: tuple[str, ...] = (),
     previous_reviews: tuple[str, ...] = (),
     author_response: str = "",
 ) -> str:
     """Generates the start prompt for an individual review.
 
     :param reviewer: The reviewer.
-    :param manuscript_text: The manuscript content.
-    :param review_criteria: Specific criteria to evaluate.
     :param previous_reviews: Previous reviews (for revision tracking).
     :param author_response: Authors' response to previous reviews.
     :return: The start prompt.
@@ -319,8 +336,6 @@ def individual_review_start_prompt(
     return (
         f"This is an individual review session with {reviewer} to evaluate a scientific manuscript.\n\n"
         f"{revision_context}"
-        f"{format_manuscript(manuscript_text)}"
-        f"{format_review_criteria(review_criteria)}"
         f"{reviewer}, please provide your comprehensive review of this manuscript.\n\n"
         f"{review_structure_prompt()}"
     )
@@ -367,6 +382,53 @@ def individual_review_revision_prompt(critic: Agent, reviewer: Agent) -> str:
     )
 
 
+# =============================================================================
+# Discussion Summary Prompts (condensing earlier rounds of long discussions)
+# =============================================================================
+
+DISCUSSION_SUMMARIZER_PROMPT = (
+    "You condense manuscript review discussions for the panel's later rounds "
+    "without losing any reviewer's concerns."
+)
+
+
+def discussion_summary_prompt(transcript: str, previous_summary: str = "") -> str:
+    """Generates the prompt to condense earlier rounds of a review discussion.
+
+    :param transcript: The turns to condense, one "Agent: message" block per turn.
+    :param previous_summary: The summary of the rounds before these turns ("" if none).
+    :return: The summary prompt.
+    """
+    if previous_summary:
+        intro = (
+            f"Here is a summary of the earlier rounds of a manuscript review discussion:\n\n"
+            f"[begin summary]\n\n{previous_summary}\n\n[end summary]\n\n"
+            f"Here are the rounds that followed:"
+        )
+    else:
+        intro = "Here are the earlier rounds of a manuscript review discussion:"
+
+    return (
+        f"{intro}\n\n"
+        f"[begin discussion]\n\n{transcript}\n\n[end discussion]\n\n"
+        f"Write one condensed summary of the discussion so far. For each participant, keep every "
+        f"substantive concern, request, and recommendation, any literature they cited, and where "
+        f"participants agreed or disagreed. Omit pleasantries and repetition."
+    )
+
+
+def format_discussion_summary(summary: str) -> str:
+    """Formats a condensed summary of earlier rounds for the discussion history.
+
+    :param summary: The summary.
+    :return: The formatted summary.
+    """
+    return (
+        f"The earlier rounds of this discussion have been condensed into the following summary:\n\n"
+        f"[begin summary]\n\n{summary}\n\n[end summary]"
+    )
+
+
 # =============================================================================
 # Default Review Criteria for Biomedical Manuscripts
 # =============================================================================
@@ -2,20 +2,73 @@
 
 from __future__ import annotations
 
+import ast
+import asyncio
 import json
-from typing import List, Tuple
+import re
+import time
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 
-from openai import OpenAI
+import tiktoken
+from openai import APIError, AsyncOpenAI, OpenAI
 
 from virtual_manuscript_reviewer.agent import Agent
-from virtual_manuscript_reviewer.constants import DEFAULT_MODEL, CONSISTENT_TEMPERATURE
+from virtual_manuscript_reviewer.constants import DEFAULT_MODEL, CONSISTENT_TEMPERATURE, CREATIVE_TEMPERATURE
+from virtual_manuscript_reviewer.llm_cache import check_cache, make_cache_key, save_cache
+from virtual_manuscript_reviewer.prompts import DEFAULT_REVIEWERS
+
+# Bump whenever the analysis prompt changes so cached reviewer panels are invalidated
+REVIEWER_PROMPT_VERSION = 3
+
+# Per-request timeout (seconds) and retry count for the analysis calls; the OpenAI
+# client retries connection errors, timeouts, 429s and 5xx with exponential backoff
+REQUEST_TIMEOUT = 120.0
+MAX_RETRIES = 4
+
+# Tokens of manuscript text shown to the model when picking reviewers
+# (about the 15,000 characters previously used, for English text)
+ANALYSIS_TOKEN_BUDGET = 4000
+
+# Structured Outputs schema so the API itself returns a valid reviewer list
+# (strict mode needs an object at the top level, hence the "reviewers" wrapper)
+_REVIEWER_FIELDS = ("title", "expertise", "goal", "role")
+_REVIEWER_PANEL_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "reviewer_panel",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "reviewers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {name: {"type": "string"} for name in _REVIEWER_FIELDS},
+                        "required": list(_REVIEWER_FIELDS),
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["reviewers"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Patterns for salvaging a reviewer list from a slightly malformed LLM response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r"\[\s*\{.*\}\s*\]", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"})
 
 
 def generate_reviewers_for_manuscript(
     manuscript_text: str,
     num_reviewers: int = 3,
     model: str = DEFAULT_MODEL,
-) -> Tuple[Agent, ...]:
+) -> tuple[Agent, ...]:
     """Analyze manuscript content and generate specialized reviewers.
 
     :param manuscript_text: The manuscript content (abstract + text).
@@ -23,8 +76,269 @@ def generate_reviewers_for_manuscript(
     :param model: The LLM model to use for analysis.
     :return: Tuple of Agent objects with specialized expertise.
     """
-    client = OpenAI()
+    # Reuse the panel from an earlier run on the same manuscript text
+    cache_key = _reviewer_cache_key(manuscript_text, num_reviewers, model)
+    reviewer_data = check_cache(cache_key)
+    if reviewer_data is None:
+        client = OpenAI(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+        received: list[str] = []
+
+        def stream_text(stream) -> Iterator[str]:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    received.append(chunk.choices[0].delta.content)
+                    yield received[-1]
+
+        try:
+            stream = client.chat.completions.create(
+                model=model,
+                messages=_analysis_messages(manuscript_text, num_reviewers),
+                temperature=CONSISTENT_TEMPERATURE,
+                response_format=_REVIEWER_PANEL_FORMAT,
+                stream=True,
+            )
+
+            # Collect reviewers as each object closes; stop once we have enough
+            reviewer_data = []
+            for reviewer in _iter_streamed_objects(stream_text(stream)):
+                reviewer_data.append(reviewer)
+                if len(reviewer_data) >= num_reviewers:
+                    stream.close()
+                    break
+        except APIError as e:
+            return _api_failure_reviewers(e)
+
+        if not reviewer_data:
+            reviewer_data = _parse_reviewer_data("".join(received))
+        if reviewer_data is not None:
+            save_cache(cache_key, reviewer_data)
+
+    return _build_reviewers(reviewer_data, num_reviewers, model)
+
+
+def generate_reviewer_panels(
+    manuscript_text: str,
+    num_panels: int = 3,
+    num_reviewers: int = 3,
+    model: str = DEFAULT_MODEL,
+) -> tuple[tuple[Agent, ...], ...]:
+    """Generate several independent candidate reviewer panels in one request.
+
+    Uses the ``n`` parameter of the chat completion, so the manuscript prompt is
+    sent and billed once however many panels are requested; only the output
+    tokens scale with ``num_panels``. Panels are sampled at the creative
+    temperature so they differ, and are not cached. If the request fails after
+    retries, every panel is the default panel.
+
+    :param manuscript_text: The manuscript content (abstract + text).
+    :param num_panels: Number of candidate panels to generate.
+    :param num_reviewers: Number of reviewers per panel.
+    :param model: The LLM model to use for analysis.
+    :return: One tuple of reviewer agents per panel.
+    """
+    client = OpenAI(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=_analysis_messages(manuscript_text, num_reviewers),
+            temperature=CREATIVE_TEMPERATURE,
+            response_format=_REVIEWER_PANEL_FORMAT,
+            n=num_panels,
+        )
+    except APIError as e:
+        # Every candidate panel falls back to the defaults, as a single panel would
+        return (_api_failure_reviewers(e),) * num_panels
+
+    return tuple(
+        _build_reviewers(_parse_reviewer_data(choice.message.content or ""), num_reviewers, model)
+        for choice in response.choices
+    )
+
+
+async def generate_reviewers_async(
+    manuscript_text: str,
+    num_reviewers: int = 3,
+    model: str = DEFAULT_MODEL,
+    client: Optional[AsyncOpenAI] = None,
+) -> tuple[Agent, ...]:
+    """Async version of generate_reviewers_for_manuscript.
+
+    :param manuscript_text: The manuscript content (abstract + text).
+    :param num_reviewers: Number of reviewers to generate (default 3).
+    :param model: The LLM model to use for analysis.
+    :param client: The async OpenAI client to use; a new one is created if not given.
+    :return: Tuple of Agent objects with specialized expertise.
+    """
+    cache_key = _reviewer_cache_key(manuscript_text, num_reviewers, model)
+    reviewer_data = check_cache(cache_key)
+    if reviewer_data is None:
+        client = client or AsyncOpenAI(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=_analysis_messages(manuscript_text, num_reviewers),
+                temperature=CONSISTENT_TEMPERATURE,
+                response_format=_REVIEWER_PANEL_FORMAT,
+            )
+        except APIError as e:
+            return _api_failure_reviewers(e)
+        reviewer_data = _parse_reviewer_data(response.choices[0].message.content or "")
+        if reviewer_data is not None:
+            save_cache(cache_key, reviewer_data)
+
+    return _build_reviewers(reviewer_data, num_reviewers, model)
+
+
+def generate_reviewers_many(
+    manuscript_texts: list[str],
+    num_reviewers: int = 3,
+    model: str = DEFAULT_MODEL,
+    max_concurrency: int = 20,
+) -> list[tuple[Agent, ...]]:
+    """Generate reviewer panels for several manuscripts with concurrent API calls.
+
+    Faster than calling generate_reviewers_for_manuscript in a loop when results
+    are needed now; use generate_reviewers_batch when they can wait. Rate-limit
+    (429) responses are retried with backoff by the OpenAI client itself.
+
+    :param manuscript_texts: The manuscript contents (abstract + text).
+    :param num_reviewers: Number of reviewers to generate per manuscript.
+    :param model: The LLM model to use for analysis.
+    :param max_concurrency: Maximum number of requests in flight at once.
+    :return: One tuple of reviewer agents per manuscript, in input order.
+    """
+    async def generate_all() -> list[tuple[Agent, ...]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Closed before asyncio.run closes the loop its connections belong to
+        async with AsyncOpenAI(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES) as client:
+            async def generate_one(manuscript_text: str) -> tuple[Agent, ...]:
+                async with semaphore:
+                    return await generate_reviewers_async(manuscript_text, num_reviewers, model, client=client)
+
+            return list(await asyncio.gather(*(generate_one(text) for text in manuscript_texts)))
+
+    return asyncio.run(generate_all())
+
 
+def generate_reviewers_batch(
+    manuscript_texts: list[str],
+    num_reviewers: int = 3,
+    model: str = DEFAULT_MODEL,
+    poll_interval: float = 30.0,
+) -> list[tuple[Agent, ...]]:
+    """Generate reviewer panels for many manuscripts through the OpenAI Batch API.
+
+    Batch requests cost half as much as regular calls but may take up to 24 hours,
+    so this is meant for bulk intake; use generate_reviewers_for_manuscript for
+    interactive runs. Manuscripts with a cached panel are not submitted.
+
+    :param manuscript_texts: The manuscript contents (abstract + text).
+    :param num_reviewers: Number of reviewers to generate per manuscript.
+    :param model: The LLM model to use for analysis.
+    :param poll_interval: Seconds to wait between batch status checks.
+    :return: One tuple of reviewer agents per manuscript, in input order.
+    """
+    cache_keys = [_reviewer_cache_key(text, num_reviewers, model) for text in manuscript_texts]
+    reviewer_data = [check_cache(key) for key in cache_keys]
+    pending = [i for i, data in enumerate(reviewer_data) if data is None]
+
+    if pending:
+        client = OpenAI(timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES)
+
+        # One chat completion request per uncached manuscript, matched back by custom_id
+        batch_input = "".join(
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": _analysis_messages(manuscript_texts[i], num_reviewers),
+                    "temperature": CONSISTENT_TEMPERATURE,
+                    "response_format": _REVIEWER_PANEL_FORMAT,
+                },
+            }) + "\n"
+            for i in pending
+        )
+        input_file = client.files.create(
+            file=("reviewer_batch.jsonl", batch_input.encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise ValueError(f"Reviewer batch {batch.id} ended with status {batch.status}")
+
+        output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            i = int(result["custom_id"])
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            response_text = response["body"]["choices"][0]["message"].get("content") or ""
+            reviewer_data[i] = _parse_reviewer_data(response_text)
+            if reviewer_data[i] is not None:
+                save_cache(cache_keys[i], reviewer_data[i])
+
+    return [_build_reviewers(data, num_reviewers, model) for data in reviewer_data]
+
+
+def _api_failure_reviewers(error: APIError) -> tuple[Agent, ...]:
+    """Fall back to the default panel when the analysis call fails after retries.
+
+    :param error: The final API error.
+    :return: The default reviewers.
+    """
+    print(f"Warning: Reviewer generation failed ({error}), using defaults")
+    return DEFAULT_REVIEWERS
+
+
+def _reviewer_cache_key(manuscript_text: str, num_reviewers: int, model: str) -> str:
+    """Build the cache key for a reviewer panel request.
+
+    :param manuscript_text: The manuscript content.
+    :param num_reviewers: Number of reviewers requested.
+    :param model: The LLM model used for analysis.
+    :return: The cache key.
+    """
+    return make_cache_key(REVIEWER_PROMPT_VERSION, model, num_reviewers, _analysis_excerpt(manuscript_text))
+
+
+@lru_cache(maxsize=8)
+def _analysis_excerpt(manuscript_text: str) -> str:
+    """Truncate the manuscript to the analysis token budget.
+
+    Cached because the cache key and the prompt both need the excerpt.
+
+    :param manuscript_text: The manuscript content.
+    :return: The leading ANALYSIS_TOKEN_BUDGET tokens of the text.
+    """
+    encoding = tiktoken.get_encoding("cl100k_base")
+    tokens = encoding.encode(manuscript_text, disallowed_special=())
+    if len(tokens) <= ANALYSIS_TOKEN_BUDGET:
+        return manuscript_text
+    return encoding.decode(tokens[:ANALYSIS_TOKEN_BUDGET])
+
+
+def _analysis_messages(manuscript_text: str, num_reviewers: int) -> list[dict]:
+    """Build the chat messages asking the LLM to propose reviewers.
+
+    :param manuscript_text: The manuscript content.
+    :param num_reviewers: Number of reviewers to request.
+    :return: The system and user messages.
+    """
     # Create a prompt to analyze the manuscript and suggest reviewers
     analysis_prompt = f"""Analyze this scientific manuscript and identify {num_reviewers} specialized reviewer profiles that would be ideal for peer review.
 
@@ -39,57 +353,143 @@ For each reviewer, provide:
 - Their goal in reviewing this specific paper
 - Their role in evaluating specific aspects
 
-Return your response as a JSON array with exactly {num_reviewers} reviewer objects.
-Each object must have these exact fields: "title", "expertise", "goal", "role"
+Return your response as a JSON object whose "reviewers" field is an array of exactly {num_reviewers} reviewer objects.
+Each reviewer object must have these exact fields: "title", "expertise", "goal", "role"
 
 Example format:
-[
-  {{
-    "title": "Synaptic Biology Expert",
-    "expertise": "synaptic vesicle dynamics, SNARE complex function, and presynaptic protein interactions",
-    "goal": "evaluate the accuracy of synaptic biology claims and the appropriateness of synaptic assays",
-    "role": "assess whether the synaptic phenotypes are properly characterized and interpreted in the context of current literature"
-  }},
-  ...
-]
+{{
+  "reviewers": [
+    {{
+      "title": "Synaptic Biology Expert",
+      "expertise": "synaptic vesicle dynamics, SNARE complex function, and presynaptic protein interactions",
+      "goal": "evaluate the accuracy of synaptic biology claims and the appropriateness of synaptic assays",
+      "role": "assess whether the synaptic phenotypes are properly characterized and interpreted in the context of current literature"
+    }},
+    ...
+  ]
+}}
 
 Here is the manuscript to analyze:
 
-{manuscript_text[:15000]}
+{_analysis_excerpt(manuscript_text)}
 
-Return ONLY the JSON array, no other text."""
+Return ONLY the JSON object, no other text."""
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an expert at identifying the ideal peer reviewers for scientific manuscripts. You understand the nuances of different research fields and can identify the specific expertise needed to properly evaluate a paper."
-            },
-            {
-                "role": "user",
-                "content": analysis_prompt
-            }
-        ],
-        temperature=CONSISTENT_TEMPERATURE,
-    )
+    return [
+        {
+            "role": "system",
+            "content": "You are an expert at identifying the ideal peer reviewers for scientific manuscripts. You understand the nuances of different research fields and can identify the specific expertise needed to properly evaluate a paper."
+        },
+        {
+            "role": "user",
+            "content": analysis_prompt
+        }
+    ]
 
-    # Parse the response
-    response_text = response.choices[0].message.content or ""
 
-    # Try to extract JSON from the response
-    try:
-        # Handle case where response might have markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
-
-        reviewer_data = json.loads(response_text.strip())
-    except json.JSONDecodeError:
+def _parse_reviewer_data(response_text: str) -> Optional[list]:
+    """Extract the JSON reviewer list from an LLM response.
+
+    Accepts the structured-output form ({"reviewers": [...]}) as well as a bare
+    array, and tries progressively more lenient readings so a salvageable
+    response is not thrown away: the raw text, the contents of a code fence, the outermost
+    array of objects, and finally each of those with trailing commas and smart
+    quotes repaired, also read as a Python literal (for single-quoted output).
+
+    :param response_text: The raw response text.
+    :return: The parsed list of reviewer dicts, or None if it could not be parsed.
+    """
+    candidates = [response_text.strip()]
+
+    # Handle case where response might have markdown code blocks
+    fence_match = _FENCE_RE.search(response_text)
+    if fence_match:
+        candidates.append(fence_match.group(1))
+
+    # Drop any commentary around the array
+    array_match = _JSON_ARRAY_RE.search(response_text)
+    if array_match:
+        candidates.append(array_match.group(0))
+
+    repaired = [_TRAILING_COMMA_RE.sub(r"\1", c.translate(_SMART_QUOTES)) for c in candidates]
+
+    for candidate in candidates + repaired:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            try:
+                data = ast.literal_eval(candidate)
+            except (ValueError, SyntaxError, MemoryError, RecursionError):
+                continue
+        if isinstance(data, dict):
+            data = data.get("reviewers")
+        if isinstance(data, list):
+            return data
+
+    return None
+
+
+def _iter_streamed_objects(pieces: Iterable[str]) -> Iterator[dict]:
+    """Yield each JSON object that is an element of an array, as soon as it is complete.
+
+    Works on streamed text for both the structured-output form
+    ({"reviewers": [{...}, ...]}) and a bare array; text that never forms a
+    complete array element yields nothing.
+
+    :param pieces: The response text, in arbitrary chunks.
+    :return: An iterator over the parsed array elements.
+    """
+    stack: list[str] = []
+    in_string = False
+    escaped = False
+    item_chars: Optional[list[str]] = None
+    item_depth = 0
+
+    for piece in pieces:
+        for char in piece:
+            if item_chars is not None:
+                item_chars.append(char)
+
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                if char == "{" and item_chars is None and stack and stack[-1] == "[":
+                    item_chars = [char]
+                    item_depth = len(stack)
+                stack.append(char)
+            elif char in "}]":
+                if stack:
+                    stack.pop()
+                if char == "}" and item_chars is not None and len(stack) == item_depth:
+                    try:
+                        yield json.loads("".join(item_chars))
+                    except json.JSONDecodeError:
+                        pass
+                    item_chars = None
+
+
+def _build_reviewers(
+    reviewer_data: Optional[list],
+    num_reviewers: int,
+    model: str,
+) -> tuple[Agent, ...]:
+    """Create reviewer agents from parsed data, filling any gaps with defaults.
+
+    :param reviewer_data: The parsed reviewer dicts, or None if parsing failed.
+    :param num_reviewers: Number of reviewers wanted.
+    :param model: The LLM model the reviewers should use.
+    :return: Tuple of reviewer agents.
+    """
+    if reviewer_data is None:
         # Fallback to default reviewers if parsing fails
         print("Warning: Could not parse reviewer suggestions, using defaults")
-        from virtual_manuscript_reviewer.prompts import DEFAULT_REVIEWERS
         return DEFAULT_REVIEWERS
 
     # Create Agent objects from the parsed data
@@ -107,10 +507,12 @@ Return ONLY the JSON array, no other text."""
         except KeyError as e:
             print(f"Warning: Missing field {e} in reviewer data, skipping")
             continue
+        except TypeError:
+            print("Warning: Malformed reviewer entry, skipping")
+            continue
 
     # If we didn't get enough reviewers, fill with defaults
     if len(reviewers) < num_reviewers:
-        from virtual_manuscript_reviewer.prompts import DEFAULT_REVIEWERS
         for default_reviewer in DEFAULT_REVIEWERS:
             if len(reviewers) >= num_reviewers:
                 break
@@ -121,7 +523,7 @@ Return ONLY the JSON array, no other text."""
     return tuple(reviewers)
 
 
-def print_reviewer_panel(reviewers: Tuple[Agent, ...]) -> None:
+def print_reviewer_panel(reviewers: tuple[Agent, ...]) -> None:
     """Print the reviewer panel for user visibility.
 
     :param reviewers: The tuple of reviewer agents.
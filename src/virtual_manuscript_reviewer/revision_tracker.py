@@ -5,14 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional
 import json
-import hashlib
+import os
 
 from diff_match_patch import diff_match_patch
 
 from virtual_manuscript_reviewer.manuscript import Manuscript
-from virtual_manuscript_reviewer.utils import load_review_summary
 
 
 @dataclass
@@ -33,15 +32,13 @@ class RevisionDiff:
 
         if self.additions:
             parts.append(f"**Additions ({len(self.additions)}):**")
-            for add in self.additions[:5]:  # Limit to first 5
-                parts.append(f"  + {add[:200]}...")
+            parts.extend(f"  + {add[:200]}..." for add in self.additions[:5])  # Limit to first 5
             if len(self.additions) > 5:
                 parts.append(f"  ... and {len(self.additions) - 5} more additions")
 
         if self.deletions:
             parts.append(f"\n**Deletions ({len(self.deletions)}):**")
-            for deletion in self.deletions[:5]:
-                parts.append(f"  - {deletion[:200]}...")
+            parts.extend(f"  - {deletion[:200]}..." for deletion in self.deletions[:5])
             if len(self.deletions) > 5:
                 parts.append(f"  ... and {len(self.deletions) - 5} more deletions")
 
@@ -49,6 +46,32 @@ class RevisionDiff:
 
         return "\n".join(parts) if parts else "No significant changes detected."
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization.
+
+        :return: Dictionary representation.
+        """
+        return {
+            "additions": self.additions,
+            "deletions": self.deletions,
+            "changes": self.changes,
+            "similarity_score": self.similarity_score,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RevisionDiff":
+        """Create a RevisionDiff from its serialized form.
+
+        :param data: Dictionary produced by to_dict.
+        :return: The RevisionDiff.
+        """
+        return cls(
+            additions=list(data.get("additions", [])),
+            deletions=list(data.get("deletions", [])),
+            changes=[tuple(change) for change in data.get("changes", [])],
+            similarity_score=data.get("similarity_score", 0.0),
+        )
+
 
 @dataclass
 class ManuscriptVersion:
@@ -77,6 +100,32 @@ class ManuscriptVersion:
             "source_path": str(self.manuscript.source_path) if self.manuscript.source_path else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ManuscriptVersion":
+        """Recreate a version from its serialized form.
+
+        The manuscript is restored without its text; RevisionTracker reads the
+        stored text snapshot when the version is compared.
+
+        :param data: Dictionary produced by to_dict.
+        :return: The ManuscriptVersion.
+        """
+        manuscript = Manuscript(
+            title=data["title"],
+            abstract="",
+            full_text="",
+            source_path=Path(data["source_path"]) if data.get("source_path") else None,
+            version_hash=data["version_hash"],
+        )
+        return cls(
+            manuscript=manuscript,
+            version_number=data["version_number"],
+            review_summary=data.get("review_summary"),
+            author_response=data.get("author_response"),
+            review_path=Path(data["review_path"]) if data.get("review_path") else None,
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+
 
 class RevisionTracker:
     """Tracks manuscript revisions and their review history."""
@@ -91,30 +140,133 @@ class RevisionTracker:
         self.versions: list[ManuscriptVersion] = []
         self._dmp = diff_match_patch()
 
+        # Diffs keyed by the (version_hash_a, version_hash_b) pair they compare
+        self._diff_cache: dict[tuple[str, str], RevisionDiff] = {}
+
         # Load existing versions if available
         self._load_history()
+        self._load_diff_cache()
 
     def _load_history(self) -> None:
-        """Load revision history from disk."""
+        """Load revision history from disk.
+
+        Each version is stored in its own file under versions/, listed in order
+        by index.json. Projects saved in the older single-file format
+        (revision_history.json) are read from that file and migrated.
+        """
+        index_file = self.project_dir / "index.json"
+        if index_file.exists():
+            with open(index_file, "r") as f:
+                index = json.load(f)
+
+            for version_number in range(1, len(index.get("versions", [])) + 1):
+                with open(self._version_path(version_number), "r") as f:
+                    self.versions.append(ManuscriptVersion.from_dict(json.load(f)))
+            return
+
         history_file = self.project_dir / "revision_history.json"
         if history_file.exists():
             with open(history_file, "r") as f:
                 history = json.load(f)
 
-            for version_data in history.get("versions", []):
-                # We can't fully reconstruct Manuscript objects without the original files
-                # So we just store the metadata for reference
-                pass  # Versions are loaded when manuscripts are re-added
+            self.versions = [ManuscriptVersion.from_dict(v) for v in history.get("versions", [])]
+            for version in self.versions:
+                self._save_history(version)
 
-    def _save_history(self) -> None:
-        """Save revision history to disk."""
-        history_file = self.project_dir / "revision_history.json"
-        history = {
-            "versions": [v.to_dict() for v in self.versions],
+    def _save_history(self, version: ManuscriptVersion) -> None:
+        """Save a new or changed version to disk.
+
+        Only that version's file and the small index are rewritten.
+
+        :param version: The version that was added or updated.
+        """
+        self._write_json(self._version_path(version.version_number), version.to_dict(), indent=2)
+        self._write_json(self.project_dir / "index.json", {
+            "versions": [v.manuscript.version_hash for v in self.versions],
             "last_updated": datetime.now().isoformat(),
-        }
-        with open(history_file, "w") as f:
-            json.dump(history, f, indent=2)
+        }, indent=2)
+
+    def _version_path(self, version_number: int) -> Path:
+        """Get the path of a version's history record.
+
+        :param version_number: The version number.
+        :return: Path to the version file.
+        """
+        return self.project_dir / "versions" / f"{version_number:04d}.json"
+
+    @staticmethod
+    def _write_json(path: Path, data: dict, indent: Optional[int] = None) -> None:
+        """Atomically write JSON data, so an interrupted save never leaves a partial file.
+
+        :param path: The destination path.
+        :param data: The data to write.
+        :param indent: JSON indentation.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+
+    def _load_diff_cache(self) -> None:
+        """Load previously computed diffs from disk."""
+        cache_file = self.project_dir / "diff_cache.json"
+        if cache_file.exists():
+            with open(cache_file, "r") as f:
+                cache = json.load(f)
+
+            for key, diff_data in cache.items():
+                hash_a, _, hash_b = key.partition(":")
+                self._diff_cache[(hash_a, hash_b)] = RevisionDiff.from_dict(diff_data)
+
+    def _save_diff_cache(self) -> None:
+        """Save computed diffs to disk."""
+        cache_file = self.project_dir / "diff_cache.json"
+        cache = {f"{hash_a}:{hash_b}": diff.to_dict() for (hash_a, hash_b), diff in self._diff_cache.items()}
+        self._write_json(cache_file, cache)
+
+    def _text_path(self, version_hash: str) -> Path:
+        """Get the path of the stored full text for a manuscript version.
+
+        :param version_hash: The manuscript's version hash.
+        :return: Path to the text snapshot.
+        """
+        return self.project_dir / "texts" / f"{version_hash}.txt"
+
+    def _save_text(self, manuscript: Manuscript) -> None:
+        """Store the manuscript's full text once per version hash.
+
+        :param manuscript: The manuscript to store.
+        """
+        text_path = self._text_path(manuscript.version_hash)
+        if not text_path.exists():
+            text_path.parent.mkdir(parents=True, exist_ok=True)
+            text_path.write_text(manuscript.full_text, encoding="utf-8")
+
+    def _has_text(self, version: ManuscriptVersion) -> bool:
+        """Check whether a version's full text is in memory or stored as a snapshot.
+
+        Versions migrated from revision_history.json have no snapshot.
+
+        :param version: The manuscript version.
+        :return: True if the full text is available.
+        """
+        return bool(version.manuscript.full_text) or self._text_path(version.manuscript.version_hash).exists()
+
+    def _load_text(self, version: ManuscriptVersion) -> str:
+        """Get a version's full text, falling back to its stored snapshot.
+
+        :param version: The manuscript version.
+        :return: The full text.
+        """
+        if version.manuscript.full_text:
+            return version.manuscript.full_text
+
+        text_path = self._text_path(version.manuscript.version_hash)
+        if not text_path.exists():
+            raise ValueError(f"Full text of version {version.version_number} is not available")
+
+        return text_path.read_text(encoding="utf-8")
 
     def add_version(
         self,
@@ -136,7 +288,8 @@ class RevisionTracker:
         )
 
         self.versions.append(version)
-        self._save_history()
+        self._save_text(manuscript)
+        self._save_history(version)
 
         return version
 
@@ -159,7 +312,7 @@ class RevisionTracker:
         version.review_summary = review_summary
         version.review_path = review_path
 
-        self._save_history()
+        self._save_history(version)
 
     def compare_versions(
         self,
@@ -168,6 +321,8 @@ class RevisionTracker:
     ) -> RevisionDiff:
         """Compare two manuscript versions.
 
+        Raises ValueError if either version's full text is not available.
+
         :param version_a: First version number.
         :param version_b: Second version number.
         :return: RevisionDiff showing changes.
@@ -177,35 +332,73 @@ class RevisionTracker:
         if version_b < 1 or version_b > len(self.versions):
             raise ValueError(f"Invalid version number: {version_b}")
 
-        text_a = self.versions[version_a - 1].manuscript.full_text
-        text_b = self.versions[version_b - 1].manuscript.full_text
+        # Checked before the cache, so a diff cached from a missing text is never returned
+        for version_number in (version_a, version_b):
+            if not self._has_text(self.versions[version_number - 1]):
+                raise ValueError(f"Full text of version {version_number} is not available")
+
+        manuscript_a = self.versions[version_a - 1].manuscript
+        manuscript_b = self.versions[version_b - 1].manuscript
+
+        # The same pair is compared for every revision context and report
+        cache_key = (manuscript_a.version_hash, manuscript_b.version_hash)
+        if cache_key in self._diff_cache:
+            return self._diff_cache[cache_key]
+
+        text_a = self._load_text(self.versions[version_a - 1])
+        text_b = self._load_text(self.versions[version_b - 1])
 
-        # Compute diff
-        diffs = self._dmp.diff_main(text_a, text_b)
+        # Compute diff at line granularity: each line becomes one character, so the
+        # diff works on line counts, and changed lines are reported whole instead
+        # of being re-diffed character by character
+        chars_a, chars_b, line_array = self._dmp.diff_linesToChars(text_a, text_b)
+        diffs = self._dmp.diff_main(chars_a, chars_b, False)
+        self._dmp.diff_charsToLines(diffs, line_array)
         self._dmp.diff_cleanupSemantic(diffs)
 
         additions = []
         deletions = []
         changes = []
 
+        # Levenshtein distance accumulated in the same pass (as dmp's diff_levenshtein):
+        # each run of edits between equalities costs max(inserted, deleted) chars
+        levenshtein = 0
+        inserted = 0
+        deleted = 0
+
         for op, text in diffs:
             if op == 1:  # Addition
-                additions.append(text.strip())
+                inserted += len(text)
+                text = text.strip()
+                if len(text) > 20:  # Filter trivial changes
+                    additions.append(text)
             elif op == -1:  # Deletion
-                deletions.append(text.strip())
+                deleted += len(text)
+                text = text.strip()
+                if len(text) > 20:
+                    deletions.append(text)
+            else:
+                levenshtein += max(inserted, deleted)
+                inserted = 0
+                deleted = 0
+        levenshtein += max(inserted, deleted)
 
         # Calculate similarity score using Levenshtein distance
-        levenshtein = self._dmp.diff_levenshtein(diffs)
         max_len = max(len(text_a), len(text_b))
         similarity = 1.0 - (levenshtein / max_len) if max_len > 0 else 1.0
 
-        return RevisionDiff(
-            additions=[a for a in additions if len(a) > 20],  # Filter trivial changes
-            deletions=[d for d in deletions if len(d) > 20],
+        diff = RevisionDiff(
+            additions=additions,
+            deletions=deletions,
             changes=changes,
             similarity_score=similarity,
         )
 
+        self._diff_cache[cache_key] = diff
+        self._save_diff_cache()
+
+        return diff
+
     def get_previous_reviews(self) -> tuple[str, ...]:
         """Get all previous review summaries.
 
@@ -243,8 +436,8 @@ class RevisionTracker:
                 parts.append(f"\n### Authors' Response to Version {i} Review")
                 parts.append(version.author_response[:2000])
 
-        # Show diff from previous version
-        if len(self.versions) >= 2:
+        # Show diff from previous version, if both texts are available
+        if self._has_text(self.versions[-2]) and self._has_text(self.versions[-1]):
             diff = self.compare_versions(len(self.versions) - 1, len(self.versions))
             parts.append("\n### Changes from Previous Version")
             parts.append(diff.get_summary())
@@ -272,8 +465,8 @@ class RevisionTracker:
                 lines.append(f"\n### Author Response")
                 lines.append(version.author_response[:1000] + "..." if len(version.author_response) > 1000 else version.author_response)
 
-            # Show changes from previous version
-            if i > 1:
+            # Show changes from previous version, if both texts are available
+            if i > 1 and self._has_text(self.versions[i - 2]) and self._has_text(version):
                 diff = self.compare_versions(i - 1, i)
                 lines.append(f"\n### Changes from Version {i-1}")
                 lines.append(diff.get_summary())
@@ -2,29 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Literal, List, Dict, Optional, Union, Tuple
+from typing import Any, Callable, Literal, List, Dict, Optional, Union, Tuple
 
-from openai import OpenAI, NOT_GIVEN
+from openai import APIError, AsyncOpenAI, NOT_GIVEN
+from openai.types import CompletionUsage
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
+    ChatCompletionMessage,
     ChatCompletionMessageParam,
     ChatCompletionToolParam,
 )
 from tqdm import trange, tqdm
 
 from virtual_manuscript_reviewer.agent import Agent
-from virtual_manuscript_reviewer.constants import CONSISTENT_TEMPERATURE, PUBMED_TOOL_DESCRIPTION
+from virtual_manuscript_reviewer.constants import (
+    CONSISTENT_TEMPERATURE,
+    PUBMED_TOOL_DESCRIPTION,
+    SUMMARY_MODEL,
+)
+from virtual_manuscript_reviewer.llm_cache import make_cache_key
 from virtual_manuscript_reviewer.manuscript import Manuscript
 from virtual_manuscript_reviewer.prompts import (
     EDITOR,
     SCIENTIFIC_CRITIC,
     DEFAULT_REVIEWERS,
     BIOMEDICAL_REVIEW_CRITERIA,
+    DISCUSSION_SUMMARIZER_PROMPT,
+    discussion_summary_prompt,
+    format_discussion_summary,
     individual_review_start_prompt,
     individual_review_critic_prompt,
     individual_review_revision_prompt,
+    manuscript_context_prompt,
     review_meeting_start_prompt,
     review_meeting_editor_initial_prompt,
     review_meeting_editor_intermediate_prompt,
@@ -32,7 +45,8 @@ from virtual_manuscript_reviewer.prompts import (
     review_meeting_reviewer_prompt,
 )
 from virtual_manuscript_reviewer.utils import (
-    count_discussion_tokens,
+    add_usage_token_counts,
+    append_to_discussion_log,
     count_tokens,
     get_summary,
     print_cost_and_time,
@@ -41,7 +55,206 @@ from virtual_manuscript_reviewer.utils import (
 )
 
 
-def run_review(
+# Maximum number of tool-call rounds (e.g. successive PubMed searches) in one agent turn
+MAX_TOOL_ROUNDS = 3
+
+# Discussions with more rounds than this have their earlier rounds condensed (with
+# SUMMARY_MODEL) once the discussion history exceeds HISTORY_SUMMARY_TOKENS tokens
+SUMMARIZE_AFTER_ROUNDS = 3
+HISTORY_SUMMARY_TOKENS = 8000
+
+# Soft cap on the length (in streamed chunks, roughly tokens) of responses in
+# intermediate rounds; only the final round's responses are saved as the review
+INTERMEDIATE_MAX_TOKENS = 2500
+
+# Appended to a response that was cut off at INTERMEDIATE_MAX_TOKENS
+TRUNCATION_NOTE = "\n\n[truncated]"
+
+
+class ReviewCancelled(Exception):
+    """Raised when a review is stopped through its should_cancel callback."""
+
+
+async def _stream_completion(
+    client: AsyncOpenAI,
+    token_counts: dict[str, int],
+    max_response_tokens: int | None = None,
+    **request: Any,
+) -> ChatCompletionMessage:
+    """Streams a chat completion, optionally stopping once the response is long enough.
+
+    :param client: The async OpenAI client.
+    :param token_counts: Token counts to add the usage of the call to.
+    :param max_response_tokens: Stop reading text after about this many tokens (None for no limit).
+    :param request: The chat completion request arguments.
+    :return: The response message; a truncated one ends with TRUNCATION_NOTE.
+    """
+    async with client.chat.completions.stream(**request, stream_options={"include_usage": True}) as stream:
+        content_chunk_count = 0
+        async for event in stream:
+            if max_response_tokens is not None and event.type == "content.delta":
+                content_chunk_count += 1
+                if content_chunk_count >= max_response_tokens:
+                    break
+        else:
+            # Usage arrives in the last chunk of a stream read to the end
+            completion = await stream.get_final_completion()
+            add_usage_token_counts(token_counts, completion.usage)
+            return completion.choices[0].message
+
+        content = stream.current_completion_snapshot.choices[0].message.content or ""
+
+    # A stopped stream reports no usage, so estimate it from the request and the text received
+    input_token_count = sum(
+        count_tokens(message["content"])
+        for message in request["messages"]
+        if isinstance(message.get("content"), str)
+    )
+    output_token_count = count_tokens(content)
+    add_usage_token_counts(token_counts, CompletionUsage(
+        prompt_tokens=input_token_count,
+        completion_tokens=output_token_count,
+        total_tokens=input_token_count + output_token_count,
+    ))
+
+    # Marked so later agents do not take the cut-off text for a complete answer
+    return ChatCompletionMessage(role="assistant", content=content + TRUNCATION_NOTE)
+
+
+async def _summarize_turns(
+    client: AsyncOpenAI,
+    turns: list[dict[str, str]],
+    previous_summary: str,
+    token_counts: dict[str, int],
+) -> str:
+    """Condenses discussion turns, together with the summary of the turns before them.
+
+    :param client: The async OpenAI client.
+    :param turns: The discussion turns to condense.
+    :param previous_summary: The summary of the earlier turns ("" if none).
+    :param token_counts: Token counts to add the API-reported usage of the call to.
+    :return: The new summary, or "" if it could not be generated.
+    """
+    # Agent responses carry the substance; prompts and raw tool output are left out
+    transcript = "\n\n".join(
+        f"{turn['agent']}: {turn['message']}"
+        for turn in turns
+        if turn["agent"] not in ("User", "Tool")
+    )
+
+    try:
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": DISCUSSION_SUMMARIZER_PROMPT},
+                {"role": "user", "content": discussion_summary_prompt(transcript, previous_summary)},
+            ],
+            temperature=CONSISTENT_TEMPERATURE,
+        )
+    except APIError as e:
+        # Condensing is only an optimization; keep the full history instead
+        print(f"Warning: Could not summarize earlier rounds: {e}")
+        return ""
+
+    add_usage_token_counts(token_counts, response.usage)
+    return response.choices[0].message.content or ""
+
+
+async def _agent_turn(
+    client: AsyncOpenAI,
+    agent: Agent,
+    context_message: ChatCompletionMessageParam,
+    messages: list[ChatCompletionMessageParam],
+    prompt: str,
+    temperature: float,
+    tools: list[ChatCompletionToolParam] | None,
+    cache_options: dict[str, str],
+    token_counts: dict[str, int],
+    max_response_tokens: int | None = None,
+) -> tuple[str, list[str], list[ChatCompletionMessageParam]]:
+    """Runs one agent turn, including any tool calls, against a discussion history.
+
+    :param client: The async OpenAI client.
+    :param agent: The agent taking the turn.
+    :param context_message: The manuscript message every agent's request starts with.
+    :param messages: The discussion so far; it is read, not modified.
+    :param prompt: The prompt for this agent's turn.
+    :param temperature: Sampling temperature.
+    :param tools: The tools the agent may call, if any.
+    :param cache_options: Extra request fields for prompt caching.
+    :param token_counts: Token counts to add the API-reported usage of this turn to.
+    :param max_response_tokens: Soft cap on the length of the agent's response (None for no limit).
+    :return: A tuple of (response content, tool outputs, tool call and tool response messages).
+    """
+    # Build messages with agent's system prompt; this is the turn's only copy of the history.
+    # The manuscript goes first, ahead of the agent-specific system prompt, so requests from
+    # all agents share it as a cached prefix
+    agent_messages: list[ChatCompletionMessageParam] = [
+        context_message,
+        agent.message,
+        *messages,
+        {"role": "user", "content": prompt},
+    ]
+
+    # Call the API
+    response_message = await _stream_completion(
+        client,
+        token_counts,
+        max_response_tokens,
+        model=agent.model,
+        messages=agent_messages,
+        temperature=temperature,
+        tools=tools if tools else NOT_GIVEN,
+        extra_body=cache_options,
+    )
+
+    tool_outputs: list[str] = []
+    tool_turn_messages: list[ChatCompletionMessageParam] = []
+
+    # Handle tool calls; the model may search again after reading results, up to a limit
+    for tool_round in range(1, MAX_TOOL_ROUNDS + 1):
+        if not response_message.tool_calls:
+            break
+
+        # PubMed searches use blocking HTTP; run_tools runs several at once, off the event loop
+        call_outputs, tool_messages = await asyncio.to_thread(
+            run_tools, tool_calls=response_message.tool_calls
+        )
+        tool_outputs.extend(call_outputs)
+
+        # Assistant message with tool calls, followed by the tool responses
+        assistant_tool_message: ChatCompletionAssistantMessageParam = {
+            "role": "assistant",
+            "content": response_message.content,
+            "tool_calls": [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+                }
+                for tc in response_message.tool_calls
+            ],
+        }
+        round_messages = [assistant_tool_message, *tool_messages]
+        tool_turn_messages.extend(round_messages)
+        agent_messages.extend(round_messages)
+
+        # Make follow-up API call; the last one gets no tools so it has to answer
+        response_message = await _stream_completion(
+            client,
+            token_counts,
+            max_response_tokens,
+            model=agent.model,
+            messages=agent_messages,
+            temperature=temperature,
+            tools=tools if tools and tool_round < MAX_TOOL_ROUNDS else NOT_GIVEN,
+            extra_body=cache_options,
+        )
+
+    return response_message.content or "", tool_outputs, tool_turn_messages
+
+
+async def arun_review(
     manuscript: Manuscript | str,
     review_type: Literal["panel", "individual"] = "panel",
     save_dir: Path | str = Path("reviews"),
@@ -59,8 +272,12 @@ def run_review(
     auto_generate_reviewers: bool = True,
     generate_pdf: bool = True,
     run_mentor: bool = True,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> str | None:
-    """Runs a manuscript review with LLM agents.
+    """Runs a manuscript review with LLM agents, as a coroutine.
+
+    Blocking steps (reviewer generation, saving, the mentor report) run in worker
+    threads, so the event loop stays free while they run.
 
     :param manuscript: The manuscript to review (Manuscript object or text string).
     :param review_type: The type of review ("panel" for multi-reviewer, "individual" for single).
@@ -78,11 +295,18 @@ def run_review(
     :param return_summary: Whether to return the review summary.
     :param generate_pdf: Whether to generate PDF output in Downloads folder.
     :param run_mentor: Whether to run the scientific mentor after review.
+    :param should_cancel: Called between rounds and stages; once it returns True the
+        review stops by raising ReviewCancelled, keeping the discussion log so far.
     :return: The review summary if return_summary is True, else None.
     """
     # Convert save_dir to Path if needed
     save_dir = Path(save_dir)
 
+    def check_cancelled() -> None:
+        """Stops the review if cancellation was requested."""
+        if should_cancel is not None and should_cancel():
+            raise ReviewCancelled("Review cancelled")
+
     # Get manuscript text
     if isinstance(manuscript, Manuscript):
         manuscript_text = manuscript.get_review_context()
@@ -101,8 +325,9 @@ def run_review(
                     print_reviewer_panel,
                 )
                 print("Analyzing manuscript to generate specialized reviewers...")
-                reviewers = generate_reviewers_for_manuscript(manuscript_text)
+                reviewers = await asyncio.to_thread(generate_reviewers_for_manuscript, manuscript_text)
                 print_reviewer_panel(reviewers)
+                check_cancelled()
             else:
                 reviewers = DEFAULT_REVIEWERS
         if len(reviewers) == 0:
@@ -124,8 +349,9 @@ def run_review(
     # Start timing
     start_time = time.time()
 
-    # Set up OpenAI client
-    client = OpenAI()
+    # Every call of this review starts with the same manuscript-bearing history, so
+    # route them to the same prompt cache
+    cache_options = {"prompt_cache_key": make_cache_key("review", manuscript_text)}
 
     # Set up team
     if review_type == "panel":
@@ -142,138 +368,200 @@ def run_review(
         [ChatCompletionToolParam(**PUBMED_TOOL_DESCRIPTION)] if pubmed_search else None  # type: ignore[misc]
     )
 
-    # Initialize tracking
-    tool_token_count = 0
+    # Initialize tracking; token counts are the usage reported by the API (estimated for
+    # responses cut off early), and tool outputs are already included in the input of the
+    # follow-up calls
+    token_counts = {"input": 0, "output": 0, "max": 0, "cached": 0}
     discussion: list[dict[str, str]] = []
+
+    # Each turn is also appended to a JSON Lines log as it happens, so an interrupted or
+    # failed review keeps its transcript; the log is removed once the review is saved
+    save_dir.mkdir(parents=True, exist_ok=True)
+    discussion_log_path = save_dir / f"{save_name}.jsonl"
+
+    # A log left by an earlier interrupted run is kept under the time it was last written to
+    if discussion_log_path.exists():
+        log_time = time.strftime("%Y%m%d-%H%M%S", time.localtime(discussion_log_path.stat().st_mtime))
+        stale_log_path = discussion_log_path.with_name(f"{save_name}.{log_time}.jsonl")
+        discussion_log_path.rename(stale_log_path)
+        print(f"Kept the log of an interrupted review as {stale_log_path}")
+
+    def record(agent_title: str, message: str) -> None:
+        """Adds a turn to the discussion and its log."""
+        turn = {"agent": agent_title, "message": message}
+        discussion.append(turn)
+        append_to_discussion_log(discussion_log_path, turn)
+
     messages: list[ChatCompletionMessageParam] = []
 
+    # The manuscript opens every request as its own unchanging message, ahead of anything
+    # that varies between agents or reviews (system prompt, panel, previous reviews, author
+    # response), so every call shares the longest possible cacheable prefix
+    manuscript_content = manuscript_context_prompt(
+        manuscript_text=manuscript_text,
+        review_criteria=review_criteria,
+    )
+    manuscript_message: ChatCompletionMessageParam = {"role": "user", "content": manuscript_content}
+    record("User", manuscript_content)
+
     # Initial prompt
     if review_type == "panel":
         assert editor is not None and reviewers is not None
         initial_content = review_meeting_start_prompt(
             editor=editor,
             reviewers=reviewers,
-            manuscript_text=manuscript_text,
-            review_criteria=review_criteria,
             previous_reviews=previous_reviews,
             author_response=author_response,
             num_rounds=num_rounds,
         )
         messages.append({"role": "user", "content": initial_content})
-        discussion.append({"agent": "User", "message": initial_content})
+        record("User", initial_content)
+
+    def round_stages(round_index: int) -> list[list[tuple[Agent, str]]]:
+        """Returns the (agent, prompt) turns of a round, grouped into stages.
 
-    # Loop through rounds
-    for round_index in trange(num_rounds + 1, desc="Rounds (+ Final Round)"):
+        Turns within a stage see the same history and run concurrently; each stage
+        sees the responses of the stages before it.
+        """
         round_num = round_index + 1
+        final_round = round_index == num_rounds
+
+        if review_type == "panel":
+            assert editor is not None and reviewers is not None
+            if round_index == 0:
+                editor_prompt = review_meeting_editor_initial_prompt(editor=editor)
+            elif final_round:
+                editor_prompt = review_meeting_editor_final_prompt(
+                    editor=editor,
+                    review_criteria=review_criteria,
+                )
+            else:
+                editor_prompt = review_meeting_editor_intermediate_prompt(
+                    editor=editor,
+                    round_num=round_num - 1,
+                    num_rounds=num_rounds,
+                )
+            stages = [[(editor, editor_prompt)]]
 
-        # Loop through team
-        for agent in tqdm(team, desc="Reviewers"):
-            # Generate prompt based on agent and round
-            if review_type == "panel":
-                assert editor is not None
-                if agent == editor:
-                    if round_index == 0:
-                        prompt = review_meeting_editor_initial_prompt(editor=editor)
-                    elif round_index == num_rounds:
-                        prompt = review_meeting_editor_final_prompt(
-                            editor=editor,
-                            review_criteria=review_criteria,
-                        )
-                    else:
-                        prompt = review_meeting_editor_intermediate_prompt(
-                            editor=editor,
-                            round_num=round_num - 1,
-                            num_rounds=num_rounds,
-                        )
-                else:
-                    prompt = review_meeting_reviewer_prompt(
+            # Final round: only the editor responds
+            if not final_round:
+                stages.append([
+                    (agent, review_meeting_reviewer_prompt(
                         reviewer=agent,
                         round_num=round_num,
                         num_rounds=num_rounds,
-                    )
+                    ))
+                    for agent in reviewers
+                ])
+        else:
+            assert reviewer is not None
+            if round_index == 0:
+                reviewer_prompt = individual_review_start_prompt(
+                    reviewer=reviewer,
+                    previous_reviews=previous_reviews,
+                    author_response=author_response,
+                )
             else:
-                assert reviewer is not None
-                if agent == SCIENTIFIC_CRITIC:
-                    prompt = individual_review_critic_prompt(
-                        critic=SCIENTIFIC_CRITIC,
-                        reviewer=reviewer,
-                    )
-                else:
-                    if round_index == 0:
-                        prompt = individual_review_start_prompt(
-                            reviewer=reviewer,
-                            manuscript_text=manuscript_text,
-                            review_criteria=review_criteria,
-                            previous_reviews=previous_reviews,
-                            author_response=author_response,
-                        )
-                    else:
-                        prompt = individual_review_revision_prompt(
-                            critic=SCIENTIFIC_CRITIC,
-                            reviewer=reviewer,
+                reviewer_prompt = individual_review_revision_prompt(
+                    critic=SCIENTIFIC_CRITIC,
+                    reviewer=reviewer,
+                )
+            stages = [[(reviewer, reviewer_prompt)]]
+
+            # Final round: only the reviewer responds
+            if not final_round:
+                stages.append([(SCIENTIFIC_CRITIC, individual_review_critic_prompt(
+                    critic=SCIENTIFIC_CRITIC,
+                    reviewer=reviewer,
+                ))])
+
+        return stages
+
+    async def run_rounds(client: AsyncOpenAI) -> None:
+        # Where the rounds start in the history (after the meeting agenda), and the running
+        # summary of the rounds condensed so far with the discussion index it covers up to
+        history_start = len(messages)
+        history_summary = ""
+        summarized_until = len(discussion)
+
+        # Loop through rounds; progress bars are skipped when stderr is not a terminal
+        # (disable=None), e.g. in CI logs, where each refresh would be a new line
+        for round_index in trange(num_rounds + 1, desc="Rounds (+ Final Round)", disable=None):
+            stages = round_stages(round_index)
+            final_round = round_index == num_rounds
+            round_message_start = len(messages)
+            round_discussion_start = len(discussion)
+
+            with tqdm(
+                total=sum(len(stage) for stage in stages),
+                desc="Reviewers",
+                leave=False,
+                disable=None,
+            ) as progress:
+                for stage in stages:
+                    check_cancelled()
+
+                    # Reviewers in a stage answer the same prompt independently, so submit them together
+                    results = await asyncio.gather(*(
+                        _agent_turn(
+                            client=client,
+                            agent=agent,
+                            context_message=manuscript_message,
+                            messages=messages,
+                            prompt=prompt,
+                            temperature=temperature,
+                            tools=tools,
+                            cache_options=cache_options,
+                            token_counts=token_counts,
+                            max_response_tokens=None if final_round else INTERMEDIATE_MAX_TOKENS,
                         )
-
-            # Add prompt as user message
-            messages.append({"role": "user", "content": prompt})
-            discussion.append({"agent": "User", "message": prompt})
-
-            # Build messages with agent's system prompt
-            agent_messages: list[ChatCompletionMessageParam] = [agent.message] + messages
-
-            # Call the API
-            response = client.chat.completions.create(
-                model=agent.model,
-                messages=agent_messages,
-                temperature=temperature,
-                tools=tools if tools else NOT_GIVEN,
-            )
-
-            response_message = response.choices[0].message
-
-            # Handle tool calls
-            if response_message.tool_calls:
-                tool_outputs, tool_messages = run_tools(tool_calls=response_message.tool_calls)
-                tool_token_count += sum(count_tokens(output) for output in tool_outputs)
-
-                # Add assistant message with tool calls
-                assistant_tool_message: ChatCompletionAssistantMessageParam = {
-                    "role": "assistant",
-                    "content": response_message.content,
-                    "tool_calls": [tc.model_dump() for tc in response_message.tool_calls],  # type: ignore[misc]
-                }
-                messages.append(assistant_tool_message)
-
-                # Add tool responses
-                for tool_msg in tool_messages:
-                    messages.append(tool_msg)
-
-                # Add to discussion
-                tool_output_content = "\n\n".join(tool_outputs)
-                discussion.append({"agent": "Tool", "message": tool_output_content})
-
-                # Make follow-up API call
-                agent_messages = [agent.message] + messages
-                response = client.chat.completions.create(
-                    model=agent.model,
-                    messages=agent_messages,
-                    temperature=temperature,
+                        for agent, prompt in stage
+                    ))
+
+                    # Record turns in panel order so the history does not depend on completion order
+                    for (agent, prompt), (response_content, tool_outputs, tool_messages) in zip(stage, results):
+                        messages.append({"role": "user", "content": prompt})
+                        record("User", prompt)
+
+                        if tool_outputs:
+                            messages.extend(tool_messages)
+                            record("Tool", "\n\n".join(tool_outputs))
+
+                        messages.append({"role": "assistant", "content": response_content})
+                        record(agent.title, response_content)
+
+                    progress.update(len(stage))
+
+            # In long discussions, condense all but the latest round once the history grows
+            # too large, so later requests stay bounded; the saved discussion keeps every turn
+            if (
+                not final_round
+                and num_rounds > SUMMARIZE_AFTER_ROUNDS
+                and round_message_start > history_start
+                and sum(
+                    count_tokens(message["content"])
+                    for message in messages[history_start:]
+                    if message.get("content")
+                ) > HISTORY_SUMMARY_TOKENS
+            ):
+                summary = await _summarize_turns(
+                    client=client,
+                    turns=discussion[summarized_until:round_discussion_start],
+                    previous_summary=history_summary,
+                    token_counts=token_counts,
                 )
-                response_message = response.choices[0].message
-
-            # Extract response
-            response_content = response_message.content or ""
-
-            # Add to messages and discussion
-            messages.append({"role": "assistant", "content": response_content})
-            discussion.append({"agent": agent.title, "message": response_content})
-
-            # Final round: only editor/reviewer responds
-            if round_index == num_rounds:
-                break
-
-    # Count tokens
-    token_counts = count_discussion_tokens(discussion=discussion)
-    token_counts["tool"] = tool_token_count
+                if summary:
+                    messages[history_start:round_message_start] = [
+                        {"role": "user", "content": format_discussion_summary(summary)}
+                    ]
+                    history_summary = summary
+                    summarized_until = round_discussion_start
+
+    # Close the client's connection pool while the loop is still running, rather than
+    # leaving it to garbage collection after asyncio.run has closed the loop
+    async with AsyncOpenAI() as client:
+        await run_rounds(client)
+    check_cancelled()
 
     # Print stats
     print_cost_and_time(
@@ -282,57 +570,77 @@ def run_review(
         elapsed_time=time.time() - start_time,
     )
 
-    # Get manuscript title for PDF
-    manuscript_title = ""
-    if isinstance(manuscript, Manuscript):
-        manuscript_title = manuscript.title
+    def save_and_run_mentor() -> str:
+        """Saves the review and runs the scientific mentor; returns the review summary."""
+        # Get manuscript title for PDF
+        manuscript_title = ""
+        if isinstance(manuscript, Manuscript):
+            manuscript_title = manuscript.title
+
+        # Save the review in the background so its PDF is built while the mentor's API call
+        # is in flight
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            save_future = executor.submit(
+                save_review,
+                save_dir=save_dir,
+                save_name=save_name,
+                discussion=discussion,
+                manuscript_title=manuscript_title,
+                generate_pdf=generate_pdf,
+            )
 
-    # Save the review
-    save_review(
-        save_dir=save_dir,
-        save_name=save_name,
-        discussion=discussion,
-        manuscript_title=manuscript_title,
-        generate_pdf=generate_pdf,
-    )
+            # Get review summary
+            review_summary = get_summary(discussion)
 
-    # Get review summary
-    review_summary = get_summary(discussion)
+            # Run scientific mentor if requested
+            if run_mentor and review_summary:
+                try:
+                    from virtual_manuscript_reviewer.scientific_mentor import (
+                        run_scientific_mentor,
+                        save_mentor_report,
+                    )
 
-    # Run scientific mentor if requested
-    if run_mentor and review_summary:
-        try:
-            from virtual_manuscript_reviewer.scientific_mentor import (
-                run_scientific_mentor,
-                save_mentor_report,
-            )
-            from virtual_manuscript_reviewer.pdf_generator import generate_mentor_pdf
+                    mentor_report = run_scientific_mentor(
+                        review_summary=review_summary,
+                        manuscript_text=manuscript_text,
+                        temperature=temperature,
+                    )
 
-            mentor_report = run_scientific_mentor(
-                review_summary=review_summary,
-                manuscript_text=manuscript_text,
-                temperature=temperature,
-            )
+                    # Save mentor report as markdown
+                    mentor_md_path = save_dir / f"{save_name}_mentor.md"
+                    save_mentor_report(mentor_report, mentor_md_path)
 
-            # Save mentor report as markdown
-            mentor_md_path = save_dir / f"{save_name}_mentor.md"
-            save_mentor_report(mentor_report, mentor_md_path)
-
-            # Save mentor report as PDF to Downloads
-            if generate_pdf:
-                pdf_output_dir = Path.home() / "Downloads"
-                mentor_pdf_path = pdf_output_dir / f"{save_name}_mentor.pdf"
-                generate_mentor_pdf(
-                    mentor_report=mentor_report,
-                    manuscript_title=manuscript_title,
-                    output_path=mentor_pdf_path,
-                )
-                print(f"Mentor PDF saved to: {mentor_pdf_path}")
+                    # Save mentor report as PDF to Downloads
+                    if generate_pdf:
+                        # Imported only here so ReportLab is not loaded (or required) without PDFs
+                        from virtual_manuscript_reviewer.pdf_generator import generate_mentor_pdf
 
-        except ImportError as e:
-            print(f"Warning: Could not run scientific mentor: {e}")
-        except Exception as e:
-            print(f"Warning: Scientific mentor failed: {e}")
+                        # ReportLab is not thread-safe; let the review PDF finish first
+                        wait([save_future])
+
+                        pdf_output_dir = Path.home() / "Downloads"
+                        mentor_pdf_path = pdf_output_dir / f"{save_name}_mentor.pdf"
+                        generate_mentor_pdf(
+                            mentor_report=mentor_report,
+                            manuscript_title=manuscript_title,
+                            output_path=mentor_pdf_path,
+                        )
+                        print(f"Mentor PDF saved to: {mentor_pdf_path}")
+
+                except ImportError as e:
+                    print(f"Warning: Could not run scientific mentor: {e}")
+                except Exception as e:
+                    print(f"Warning: Scientific mentor failed: {e}")
+
+            # Raise any error from saving the review
+            save_future.result()
+
+        return review_summary
+
+    review_summary = await asyncio.to_thread(save_and_run_mentor)
+
+    # The saved JSON now holds the full discussion
+    discussion_log_path.unlink(missing_ok=True)
 
     # Return summary if requested
     if return_summary:
@@ -341,6 +649,82 @@ def run_review(
     return None
 
 
+def run_review(
+    manuscript: Manuscript | str,
+    review_type: Literal["panel", "individual"] = "panel",
+    save_dir: Path | str = Path("reviews"),
+    save_name: str = "review",
+    editor: Agent | None = None,
+    reviewers: tuple[Agent, ...] | None = None,
+    reviewer: Agent | None = None,
+    review_criteria: tuple[str, ...] = BIOMEDICAL_REVIEW_CRITERIA,
+    previous_reviews: tuple[str, ...] = (),
+    author_response: str = "",
+    num_rounds: int = 1,
+    temperature: float = CONSISTENT_TEMPERATURE,
+    pubmed_search: bool = True,
+    return_summary: bool = False,
+    auto_generate_reviewers: bool = True,
+    generate_pdf: bool = True,
+    run_mentor: bool = True,
+    should_cancel: Callable[[], bool] | None = None,
+) -> str | None:
+    """Runs a manuscript review with LLM agents.
+
+    Blocking wrapper of arun_review. When called while an event loop is already
+    running (e.g. in Jupyter), the review runs on its own loop in a worker thread.
+
+    :param manuscript: The manuscript to review (Manuscript object or text string).
+    :param review_type: The type of review ("panel" for multi-reviewer, "individual" for single).
+    :param save_dir: Directory to save the review.
+    :param save_name: Name for the saved review files.
+    :param editor: The editor for panel reviews (uses default if None).
+    :param reviewers: The reviewer panel for panel reviews (uses defaults if None).
+    :param reviewer: The reviewer for individual reviews.
+    :param review_criteria: Criteria to evaluate the manuscript on.
+    :param previous_reviews: Previous review summaries (for revision tracking).
+    :param author_response: Authors' response to previous reviews.
+    :param num_rounds: Number of discussion rounds.
+    :param temperature: Sampling temperature.
+    :param pubmed_search: Whether to enable PubMed search tool.
+    :param return_summary: Whether to return the review summary.
+    :param generate_pdf: Whether to generate PDF output in Downloads folder.
+    :param run_mentor: Whether to run the scientific mentor after review.
+    :param should_cancel: Called between rounds and stages; once it returns True the
+        review stops by raising ReviewCancelled, keeping the discussion log so far.
+    :return: The review summary if return_summary is True, else None.
+    """
+    review = arun_review(
+        manuscript=manuscript,
+        review_type=review_type,
+        save_dir=save_dir,
+        save_name=save_name,
+        editor=editor,
+        reviewers=reviewers,
+        reviewer=reviewer,
+        review_criteria=review_criteria,
+        previous_reviews=previous_reviews,
+        author_response=author_response,
+        num_rounds=num_rounds,
+        temperature=temperature,
+        pubmed_search=pubmed_search,
+        return_summary=return_summary,
+        auto_generate_reviewers=auto_generate_reviewers,
+        generate_pdf=generate_pdf,
+        run_mentor=run_mentor,
+        should_cancel=should_cancel,
+    )
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(review)
+
+    # asyncio.run cannot be nested in a running loop, so give the review a thread of its own
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, review).result()
+
+
 def review_manuscript(
     pdf_path: str | Path,
     save_dir: str | Path = "reviews",
@@ -355,14 +739,13 @@ def review_manuscript(
     :param num_rounds: Number of discussion rounds.
     :return: The review summary.
     """
-    # Load manuscript
-    manuscript = Manuscript.from_pdf(pdf_path)
+    # Load manuscript, reusing the parse from an earlier review of the same file
+    manuscript = Manuscript.from_pdf(pdf_path, cache_dir=Path(save_dir) / ".manuscript_cache")
     print(f"Loaded manuscript: {manuscript.title}")
     print(f"Version hash: {manuscript.version_hash}")
 
     # Generate save name from manuscript
-    safe_title = "".join(c if c.isalnum() or c in "- " else "_" for c in manuscript.title[:50])
-    save_name = f"{safe_title}_{manuscript.version_hash}"
+    save_name = manuscript.safe_save_name
 
     # Run review
     summary = run_review(
@@ -10,7 +10,8 @@ from openai import OpenAI
 
 from virtual_manuscript_reviewer.agent import Agent
 from virtual_manuscript_reviewer.constants import DEFAULT_MODEL, CONSISTENT_TEMPERATURE
-from virtual_manuscript_reviewer.utils import count_tokens, print_cost_and_time
+from virtual_manuscript_reviewer.llm_cache import check_cache, make_cache_key, save_cache
+from virtual_manuscript_reviewer.utils import add_usage_token_counts, print_cost_and_time
 
 
 # Scientific Mentor Agent
@@ -135,14 +136,26 @@ def run_scientific_mentor(
     print("\nGenerating Scientific Mentor guidance...")
     start_time = time.time()
 
-    client = OpenAI()
-
     # Build messages
     messages = [
         {"role": "system", "content": f"{MENTOR_SYSTEM_PROMPT}\n\n{SCIENTIFIC_MENTOR.message['content']}"},
         {"role": "user", "content": generate_mentor_prompt(review_summary, manuscript_text)},
     ]
 
+    # The report depends only on the request, so reuse one generated for the same review
+    cache_key = make_cache_key(
+        "mentor",
+        SCIENTIFIC_MENTOR.model,
+        temperature,
+        *(message["content"] for message in messages),
+    )
+    mentor_report = check_cache(cache_key)
+    if mentor_report is not None:
+        print("Using cached Scientific Mentor guidance")
+        return mentor_report
+
+    client = OpenAI()
+
     # Call the API
     response = client.chat.completions.create(
         model=SCIENTIFIC_MENTOR.model,
@@ -151,16 +164,12 @@ def run_scientific_mentor(
     )
 
     mentor_report = response.choices[0].message.content or ""
+    if mentor_report:
+        save_cache(cache_key, mentor_report)
 
-    # Calculate and print stats
-    input_tokens = sum(count_tokens(m.get("content", "")) for m in messages)
-    output_tokens = count_tokens(mentor_report)
-
-    token_counts = {
-        "input": input_tokens,
-        "output": output_tokens,
-        "max": input_tokens + output_tokens,
-    }
+    # Print stats from the usage reported by the API
+    token_counts = {"input": 0, "output": 0, "max": 0}
+    add_usage_token_counts(token_counts, response.usage)
 
     print_cost_and_time(
         token_counts=token_counts,
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
 import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
@@ -11,72 +16,158 @@ import ssl
 import warnings
 import certifi
 import requests
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 import tiktoken
 
 # Suppress SSL warnings when using fallback
 warnings.filterwarnings("ignore", category=InsecureRequestWarning)
+from openai.types import CompletionUsage
 from openai.types.chat import ChatCompletionMessageParam
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall
 
 from virtual_manuscript_reviewer.constants import (
-    MODEL_TO_INPUT_PRICE_PER_TOKEN,
-    MODEL_TO_OUTPUT_PRICE_PER_TOKEN,
+    MODEL_TO_PRICE_PER_TOKEN,
     PUBMED_TOOL_NAME,
 )
 
+# Parse and serialize JSON with the much faster orjson when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str | bytes) -> object:
+    """Parses JSON, using orjson when it is installed.
+
+    :param data: The JSON text or its UTF-8 encoding.
+    :return: The parsed JSON.
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# (connect, read) timeout in seconds for NCBI requests
+NCBI_TIMEOUT = (5, 30)
+
+
+class _PreloadedSSLAdapter(HTTPAdapter):
+    """HTTP adapter that verifies TLS with one shared SSL context with the CAs already loaded."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs) -> None:
+        # Set before super().__init__, which builds the pool manager
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _make_ncbi_session(ssl_context: ssl.SSLContext | None) -> requests.Session:
+    """Creates a pooled HTTP session that retries transient NCBI errors.
+
+    :param ssl_context: The SSL context with the CAs to verify against, or None to skip verification.
+    :return: The session.
+    """
+    adapter_kwargs = dict(
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+
+    session = requests.Session()
+    if ssl_context is None:
+        session.verify = False
+        session.mount("https://", HTTPAdapter(**adapter_kwargs))
+    else:
+        # verify stays True, so requests passes no CA bundle path of its own and the
+        # pools verify with the shared context
+        session.mount("https://", _PreloadedSSLAdapter(ssl_context, **adapter_kwargs))
+
+    return session
+
+
+# certifi's CA bundle, parsed once for all verified NCBI connections
+_NCBI_SSL_CONTEXT = create_urllib3_context()
+_NCBI_SSL_CONTEXT.load_verify_locations(cafile=certifi.where())
+
+# Shared sessions so PubMed requests reuse connections instead of a new TLS handshake each
+_NCBI_SESSION = _make_ncbi_session(ssl_context=_NCBI_SSL_CONTEXT)
+_INSECURE_NCBI_SESSION = _make_ncbi_session(ssl_context=None)
+
+
+def _ncbi_get(url: str) -> requests.Response:
+    """Gets an NCBI URL, falling back to no SSL verification if verification fails.
+
+    :param url: The URL.
+    :return: The successful response.
+    """
+    try:
+        response = _NCBI_SESSION.get(url, timeout=NCBI_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.SSLError:
+        # Fallback: try without SSL verification (less secure but functional)
+        response = _INSECURE_NCBI_SESSION.get(url, timeout=NCBI_TIMEOUT)
+        response.raise_for_status()
+
+    return response
+
+
+# BioC passage types that hold article text
+PASSAGE_TYPES = frozenset({"abstract", "paragraph"})
+
+# BioC section types returned for abstracts only and for full text
+ABSTRACT_SECTION_TYPES = frozenset({"ABSTRACT"})
+FULL_TEXT_SECTION_TYPES = frozenset({"ABSTRACT", "INTRO", "RESULTS", "DISCUSS", "CONCL", "METHODS"})
+
 
 def get_pubmed_central_article(pmcid: str, abstract_only: bool = False) -> tuple[str | None, list[str] | None]:
     """Gets the title and content of a PubMed Central article given a PMC ID.
 
+    Articles are fetched once per process, since reviewers often find the same ones.
+
     :param pmcid: The PMC ID of the article.
     :param abstract_only: Whether to return only the abstract.
     :return: The title and content or None if not found.
     """
+    title, content = _fetch_pubmed_central_article(pmcid, abstract_only)
+    return title, None if content is None else list(content)
+
+
+@lru_cache(maxsize=256)
+def _fetch_pubmed_central_article(pmcid: str, abstract_only: bool) -> tuple[str | None, tuple[str, ...] | None]:
+    """Fetches and parses a PubMed Central article, keeping results for repeat lookups.
+
+    :param pmcid: The PMC ID of the article.
+    :param abstract_only: Whether to return only the abstract.
+    :return: The title and content (as a tuple, so cached results cannot be mutated) or None if not found.
+    """
     text_url = f"https://www.ncbi.nlm.nih.gov/research/bionlp/RESTful/pmcoa.cgi/BioC_JSON/PMC{pmcid}/unicode"
-    try:
-        response = requests.get(text_url, verify=certifi.where())
-        response.raise_for_status()
-    except requests.exceptions.SSLError:
-        # Fallback: try without SSL verification (less secure but functional)
-        response = requests.get(text_url, verify=False)
-        response.raise_for_status()
+    response = _ncbi_get(text_url)
 
     try:
-        article = response.json()
+        article = _json_loads(response.content)
     except json.JSONDecodeError:
         return None, None
 
     document = article[0]["documents"][0]
-    title = next(
-        passage["text"]
-        for passage in document["passages"]
-        if passage["infons"]["section_type"] == "TITLE"
-    )
+    allowed_sections = ABSTRACT_SECTION_TYPES if abstract_only else FULL_TEXT_SECTION_TYPES
 
-    passages = [
-        passage
-        for passage in document["passages"]
-        if passage["infons"]["type"] in {"abstract", "paragraph"}
-    ]
+    # Pick out the title and the wanted passages in one pass
+    title = None
+    content = []
+    for passage in document["passages"]:
+        infons = passage["infons"]
+        section_type = infons.get("section_type")
 
-    if abstract_only:
-        passages = [
-            passage
-            for passage in passages
-            if passage["infons"]["section_type"] in ["ABSTRACT"]
-        ]
-    else:
-        passages = [
-            passage
-            for passage in passages
-            if passage["infons"]["section_type"]
-            in ["ABSTRACT", "INTRO", "RESULTS", "DISCUSS", "CONCL", "METHODS"]
-        ]
-
-    content = [passage["text"] for passage in passages]
+        if title is None and section_type == "TITLE":
+            title = passage["text"]
+        elif infons.get("type") in PASSAGE_TYPES and section_type in allowed_sections:
+            content.append(passage["text"])
 
-    return title, content
+    return title, tuple(content)
 
 
 def run_pubmed_search(query: str, num_articles: int = 3, abstract_only: bool = False) -> str:
@@ -96,47 +187,49 @@ def run_pubmed_search(query: str, num_articles: int = 3, abstract_only: bool = F
         f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?"
         f"db=pmc&term={urllib.parse.quote_plus(query)}&retmax={2 * num_articles}&retmode=json&sort=relevance"
     )
-    try:
-        response = requests.get(search_url, verify=certifi.where())
-        response.raise_for_status()
-    except requests.exceptions.SSLError:
-        # Fallback: try without SSL verification
-        response = requests.get(search_url, verify=False)
-        response.raise_for_status()
+    response = _ncbi_get(search_url)
     pmcids_found = response.json()["esearchresult"]["idlist"]
 
-    texts = []
-    titles = []
-    pmcids = []
+    # (PMCID, title, text) of each article found
+    found_articles: list[tuple[str, str, str]] = []
 
-    for pmcid in pmcids_found:
-        if len(pmcids) >= num_articles:
-            break
-
-        title, content = get_pubmed_central_article(
-            pmcid=pmcid,
-            abstract_only=abstract_only,
+    # Fetch the top num_articles concurrently, and start on the next PMCID only when one of
+    # them turns out to be unusable; results are still taken in relevance order
+    remaining_pmcids = iter(pmcids_found)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(num_articles, len(pmcids_found))))
+    try:
+        fetches = deque(
+            (pmcid, executor.submit(get_pubmed_central_article, pmcid=pmcid, abstract_only=abstract_only))
+            for pmcid in islice(remaining_pmcids, num_articles)
         )
 
-        if title is None:
-            continue
+        while fetches and len(found_articles) < num_articles:
+            pmcid, fetch = fetches.popleft()
+            title, content = fetch.result()
 
-        texts.append(f"PMCID = {pmcid}\n\nTitle = {title}\n\n{chr(10).join(content or [])}")
-        titles.append(title)
-        pmcids.append(pmcid)
+            if title is None:
+                for next_pmcid in islice(remaining_pmcids, 1):
+                    fetches.append((
+                        next_pmcid,
+                        executor.submit(get_pubmed_central_article, pmcid=next_pmcid, abstract_only=abstract_only),
+                    ))
+                continue
 
-    article_count = len(texts)
+            found_articles.append((pmcid, title, "\n".join(content or ())))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    article_count = len(found_articles)
     print(f"Found {article_count:,} articles on PubMed Central")
 
     if article_count == 0:
         return f'No articles found on PubMed Central for the query "{query}".'
 
-    formatted_articles = []
-    for i, text in enumerate(texts):
-        formatted_articles.append(f"[begin article {i + 1}]\n\n{text}\n\n[end article {i + 1}]")
-
     intro = f'Here are the top {article_count} articles on PubMed Central for the query "{query}":'
-    return f"{intro}\n\n{''.join(formatted_articles)}"
+    return intro + "\n\n" + "".join(
+        f"[begin article {i}]\n\nPMCID = {pmcid}\n\nTitle = {title}\n\n{text}\n\n[end article {i}]"
+        for i, (pmcid, title, text) in enumerate(found_articles, start=1)
+    )
 
 
 def run_tools(
@@ -147,26 +240,43 @@ def run_tools(
     :param tool_calls: The tool calls from the chat completion response.
     :return: A tuple of (tool outputs, tool response messages).
     """
-    tool_outputs: list[str] = []
-    tool_messages: list[ChatCompletionMessageParam] = []
-
     for tool_call in tool_calls:
-        if tool_call.function.name == PUBMED_TOOL_NAME:
-            args_dict = json.loads(tool_call.function.arguments)
-            output = run_pubmed_search(**args_dict)
-            tool_outputs.append(output)
-
-            tool_messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "content": output,
-            })
-        else:
+        if tool_call.function.name != PUBMED_TOOL_NAME:
             raise ValueError(f"Unknown tool: {tool_call.function.name}")
 
+    def run_pubmed_tool_call(tool_call: ChatCompletionMessageToolCall) -> str:
+        args_dict = _json_loads(tool_call.function.arguments)
+        return run_pubmed_search(**args_dict)
+
+    # PubMed searches block on HTTP, so several in one response run concurrently
+    if len(tool_calls) > 1:
+        with ThreadPoolExecutor(max_workers=len(tool_calls)) as executor:
+            tool_outputs = list(executor.map(run_pubmed_tool_call, tool_calls))
+    else:
+        tool_outputs = [run_pubmed_tool_call(tool_call) for tool_call in tool_calls]
+
+    tool_messages: list[ChatCompletionMessageParam] = [
+        {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "content": output,
+        }
+        for tool_call, output in zip(tool_calls, tool_outputs)
+    ]
+
     return tool_outputs, tool_messages
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Returns a tiktoken encoding, looked up once per name.
+
+    :param encoding_name: The encoding name.
+    :return: The encoding.
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
 def count_tokens(string: str, encoding_name: str = "cl100k_base") -> int:
     """Returns the number of tokens in a text string.
 
@@ -174,23 +284,53 @@ def count_tokens(string: str, encoding_name: str = "cl100k_base") -> int:
     :param encoding_name: The encoding name.
     :return: The token count.
     """
-    encoding = tiktoken.get_encoding(encoding_name)
-    return len(encoding.encode(string))
+    return len(_get_encoding(encoding_name).encode_ordinary(string))
+
+
+def count_tokens_batch(strings: list[str], encoding_name: str = "cl100k_base") -> list[int]:
+    """Returns the number of tokens in each of several text strings.
+
+    The strings are encoded together by tiktoken, which releases the GIL and spreads
+    the work over its own thread pool.
+
+    :param strings: The text strings.
+    :param encoding_name: The encoding name.
+    :return: The token count of each string, in order.
+    """
+    encoding = _get_encoding(encoding_name)
+    return [
+        len(tokens)
+        for tokens in encoding.encode_ordinary_batch(strings, num_threads=os.cpu_count() or 1)
+    ]
+
+
+def estimate_tokens(string: str) -> int:
+    """Estimates the number of tokens in a text string as about four characters per token.
+
+    Much cheaper than count_tokens, for cost tracking where a rough count is enough.
+
+    :param string: The text string.
+    :return: The estimated token count.
+    """
+    return (len(string) + 3) // 4
 
 
 def update_token_counts(
     token_counts: dict[str, int],
     discussion: list[dict[str, str]],
     response: str,
+    exact: bool = False,
 ) -> None:
     """Updates the token counts with a discussion and response.
 
     :param token_counts: The token counts to update.
     :param discussion: The discussion.
     :param response: The response.
+    :param exact: Whether to tokenize with tiktoken rather than estimate the counts.
     """
-    new_input_token_count = sum(count_tokens(turn["message"]) for turn in discussion)
-    new_output_token_count = count_tokens(response)
+    token_counter = count_tokens if exact else estimate_tokens
+    new_input_token_count = sum(token_counter(turn["message"]) for turn in discussion)
+    new_output_token_count = token_counter(response)
 
     token_counts["input"] += new_input_token_count
     token_counts["output"] += new_output_token_count
@@ -199,40 +339,76 @@ def update_token_counts(
     )
 
 
-def count_discussion_tokens(discussion: list[dict[str, str]]) -> dict[str, int]:
+def add_usage_token_counts(token_counts: dict[str, int], usage: CompletionUsage | None) -> None:
+    """Adds the API-reported token usage of one chat completion to the token counts.
+
+    :param token_counts: The token counts to update.
+    :param usage: The usage of the chat completion response (may be None).
+    """
+    if usage is None:
+        return
+
+    input_token_count = usage.prompt_tokens
+    output_token_count = usage.completion_tokens
+    # Older SDK versions have no prompt_tokens_details
+    details = getattr(usage, "prompt_tokens_details", None)
+
+    token_counts["input"] += input_token_count
+    token_counts["output"] += output_token_count
+    token_counts["cached"] = token_counts.get("cached", 0) + (getattr(details, "cached_tokens", 0) or 0)
+    token_counts["max"] = max(token_counts["max"], input_token_count + output_token_count)
+
+
+def count_discussion_tokens(discussion: list[dict[str, str]], exact: bool = False) -> dict[str, int]:
     """Counts the number of tokens in a discussion.
 
     :param discussion: The discussion.
+    :param exact: Whether to tokenize with tiktoken rather than estimate the counts.
     :return: Token counts dictionary.
     """
     token_counts = {"input": 0, "output": 0, "max": 0}
 
-    for index, turn in enumerate(discussion):
+    # Each turn is counted once; its input is the running total of the turns before it
+    messages = [turn["message"] for turn in discussion]
+    if exact:
+        turn_token_counts = count_tokens_batch(messages)
+    else:
+        turn_token_counts = [estimate_tokens(message) for message in messages]
+
+    prefix_token_count = 0
+    for turn, turn_token_count in zip(discussion, turn_token_counts):
         if turn["agent"] != "User":
-            update_token_counts(
-                token_counts=token_counts,
-                discussion=discussion[:index],
-                response=turn["message"],
-            )
+            token_counts["input"] += prefix_token_count
+            token_counts["output"] += turn_token_count
+            token_counts["max"] = max(token_counts["max"], prefix_token_count + turn_token_count)
+
+        prefix_token_count += turn_token_count
 
     return token_counts
 
 
-def _find_model_price_key(model: str, price_dict: dict[str, float]) -> str | None:
-    """Finds the matching key in a price dictionary for a model.
+# Price keys tried longest first, so the first prefix match is the most specific one
+_PRICE_KEYS_BY_LENGTH = tuple(sorted(MODEL_TO_PRICE_PER_TOKEN, key=len, reverse=True))
+
+
+def _find_model_price_key(model: str, price_keys: tuple[str, ...]) -> str | None:
+    """Finds the longest price key that the model name starts with.
 
     :param model: The model name.
-    :param price_dict: The price dictionary.
+    :param price_keys: The price keys, sorted from longest to shortest.
     :return: The matching key or None.
     """
-    if model in price_dict:
-        return model
+    return next((key for key in price_keys if model.startswith(key)), None)
 
-    matching_keys = [key for key in price_dict if model.startswith(key)]
-    if matching_keys:
-        return max(matching_keys, key=len)
 
-    return None
+@lru_cache(maxsize=128)
+def _get_model_price_key(model: str) -> str | None:
+    """Finds the key in MODEL_TO_PRICE_PER_TOKEN for a model, once per model name.
+
+    :param model: The model name.
+    :return: The matching key or None.
+    """
+    return _find_model_price_key(model, _PRICE_KEYS_BY_LENGTH)
 
 
 def compute_token_cost(model: str, input_token_count: int, output_token_count: int) -> float:
@@ -243,16 +419,13 @@ def compute_token_cost(model: str, input_token_count: int, output_token_count: i
     :param output_token_count: Output tokens.
     :return: The cost in USD.
     """
-    input_key = _find_model_price_key(model, MODEL_TO_INPUT_PRICE_PER_TOKEN)
-    output_key = _find_model_price_key(model, MODEL_TO_OUTPUT_PRICE_PER_TOKEN)
+    price_key = _get_model_price_key(model)
 
-    if input_key is None or output_key is None:
+    if price_key is None:
         raise ValueError(f'Cost of model "{model}" not known')
 
-    return (
-        input_token_count * MODEL_TO_INPUT_PRICE_PER_TOKEN[input_key]
-        + output_token_count * MODEL_TO_OUTPUT_PRICE_PER_TOKEN[output_key]
-    )
+    input_price, output_price = MODEL_TO_PRICE_PER_TOKEN[price_key]
+    return input_token_count * input_price + output_token_count * output_price
 
 
 def print_cost_and_time(
@@ -267,8 +440,11 @@ def print_cost_and_time(
     :param elapsed_time: Elapsed time in seconds.
     """
     print(f"Input token count: {token_counts['input']:,}")
+    if "cached" in token_counts:
+        print(f"Cached input token count: {token_counts['cached']:,}")
     print(f"Output token count: {token_counts['output']:,}")
-    print(f"Tool token count: {token_counts.get('tool', 0):,}")
+    if "tool" in token_counts:
+        print(f"Tool token count: {token_counts['tool']:,}")
     print(f"Max token length: {token_counts['max']:,}")
 
     try:
@@ -293,6 +469,21 @@ def get_summary(discussion: list[dict[str, str]]) -> str:
     return discussion[-1]["message"]
 
 
+def append_to_discussion_log(log_path: Path, turn: dict[str, str]) -> None:
+    """Appends one discussion turn to a JSON Lines log.
+
+    :param log_path: The log file.
+    :param turn: The discussion turn.
+    """
+    if orjson is not None:
+        line = orjson.dumps(turn)
+    else:
+        # Match orjson's compact UTF-8 output
+        line = json.dumps(turn, ensure_ascii=False, separators=(",", ":")).encode()
+    with open(log_path, "ab") as f:
+        f.write(line + b"\n")
+
+
 def save_review(
     save_dir: Path,
     save_name: str,
@@ -317,15 +508,21 @@ def save_review(
 
     # Save as JSON
     json_path = save_dir / f"{save_name}.json"
-    with open(json_path, "w") as f:
-        json.dump(discussion, f, indent=4)
+    # orjson only indents by 2 and writes UTF-8 rather than ASCII escapes, so the
+    # fallback does the same and the file does not depend on which one is installed
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(discussion, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(discussion, f, indent=2, ensure_ascii=False)
     saved_files["json"] = json_path
 
     # Save as Markdown
     md_path = save_dir / f"{save_name}.md"
-    with open(md_path, "w", encoding="utf-8") as file:
-        for turn in discussion:
-            file.write(f"## {turn['agent']}\n\n{turn['message']}\n\n")
+    md_path.write_text(
+        "".join(f"## {turn['agent']}\n\n{turn['message']}\n\n" for turn in discussion),
+        encoding="utf-8",
+    )
     saved_files["markdown"] = md_path
 
     # Generate PDF
@@ -362,8 +559,7 @@ def load_review_summary(review_path: Path) -> str:
     :param review_path: Path to the review JSON file.
     :return: The review summary.
     """
-    with open(review_path, "r") as f:
-        discussion = json.load(f)
+    discussion = _json_loads(Path(review_path).read_bytes())
     return get_summary(discussion)
 
 
@@ -373,4 +569,9 @@ def load_review_summaries(review_paths: list[Path]) -> tuple[str, ...]:
     :param review_paths: Paths to review JSON files.
     :return: Tuple of review summaries.
     """
-    return tuple(load_review_summary(path) for path in review_paths)
+    if len(review_paths) <= 1:
+        return tuple(load_review_summary(path) for path in review_paths)
+
+    # Overlap the file reads; map keeps the summaries in path order
+    with ThreadPoolExecutor(max_workers=min(32, len(review_paths))) as executor:
+        return tuple(executor.map(load_review_summary, review_paths))
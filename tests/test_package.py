@@ -0,0 +1,61 @@
+"""Tests for the package's public re-exports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "first_import",
+    [
+        "import virtual_manuscript_reviewer",
+        "import virtual_manuscript_reviewer.run_review",
+        "from virtual_manuscript_reviewer.run_review import review_manuscript",
+    ],
+)
+def test_run_review_is_the_function(first_import: str) -> None:
+    """run_review stays the function whichever import comes first."""
+    code = (
+        f"{first_import}\n"
+        "from virtual_manuscript_reviewer import run_review\n"
+        "assert callable(run_review), run_review\n"
+    )
+    # A fresh interpreter, so the import order is not affected by other tests
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["virtual_manuscript_reviewer", "virtual_manuscript_reviewer.cli", "virtual_manuscript_reviewer.gui"],
+)
+def test_entry_points_defer_heavy_imports(module: str) -> None:
+    """Importing the package or its entry points does not load Qt or the OpenAI or PDF stack."""
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        "loaded = [name for name in ('openai', 'fitz', 'tiktoken', 'reportlab', 'PyQt6') if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["--pdf", "missing.pdf"]])
+def test_cli_exits_early_without_review_stack(argv: list[str], tmp_path: Path) -> None:
+    """vmr --help and a missing PDF return before loading the OpenAI or PDF stack."""
+    code = (
+        "import sys\n"
+        f"sys.argv = ['vmr', *{argv!r}]\n"
+        "from virtual_manuscript_reviewer.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [name for name in ('openai', 'fitz', 'tiktoken', 'reportlab') if name in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
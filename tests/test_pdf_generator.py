@@ -0,0 +1,30 @@
+"""Tests for inline markdown formatting in the PDF generator."""
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from virtual_manuscript_reviewer.pdf_generator import _apply_inline_formatting
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("plain text", "plain text"),
+        ("**a** and **b**", "<b>a</b> and <b>b</b>"),
+        ("*a* and **b**", "<i>a</i> and <b>b</b>"),
+        ("_a_ __b__", "<i>a</i> <b>b</b>"),
+        ("use `code` here", 'use <font face="Courier">code</font> here'),
+        ("**unclosed", "**unclosed"),
+        # Nested markup
+        ("*italic **bold** x*", "<i>italic <b>bold</b> x</i>"),
+        ("**bold *it* more**", "<b>bold <i>it</i> more</b>"),
+        ("_italic __bold__ x_", "<i>italic <b>bold</b> x</i>"),
+        # Bold italic
+        ("***x***", "<b><i>x</i></b>"),
+        ("___x___", "<b><i>x</i></b>"),
+    ],
+)
+def test_apply_inline_formatting(text: str, expected: str) -> None:
+    """Inline markdown is converted to ReportLab tags."""
+    assert _apply_inline_formatting(text) == expected
@@ -0,0 +1,26 @@
+"""Tests for the package metadata in pyproject.toml."""
+
+from pathlib import Path
+
+import pytest
+
+tomllib = pytest.importorskip("tomllib")
+requirements = pytest.importorskip("packaging.requirements")
+
+PYPROJECT_PATH = Path(__file__).parent.parent / "pyproject.toml"
+
+
+def test_pyproject_metadata() -> None:
+    """The project table keeps its fields and every dependency is a valid requirement."""
+    project = tomllib.loads(PYPROJECT_PATH.read_text())["project"]
+
+    assert project["classifiers"]
+    assert project["keywords"]
+    assert set(project["optional-dependencies"]) == {"speedups"}
+
+    for requirement in project["dependencies"] + [
+        requirement
+        for extra in project["optional-dependencies"].values()
+        for requirement in extra
+    ]:
+        requirements.Requirement(requirement)
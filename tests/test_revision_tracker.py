@@ -0,0 +1,45 @@
+"""Tests for revision tracking."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from virtual_manuscript_reviewer.manuscript import Manuscript
+from virtual_manuscript_reviewer.revision_tracker import RevisionTracker
+
+
+def _manuscript(full_text: str, version_hash: str) -> Manuscript:
+    return Manuscript(title="Title", abstract="", full_text=full_text, version_hash=version_hash)
+
+
+def test_compare_versions(tmp_path: Path) -> None:
+    """Versions added to a tracker can be compared, also after reloading it."""
+    tracker = RevisionTracker(tmp_path)
+    tracker.add_version(_manuscript("Shared introduction text for both versions.\n", "a"))
+    tracker.add_version(_manuscript(
+        "Shared introduction text for both versions.\nA new paragraph added in the revision.\n", "b"
+    ))
+
+    diff = RevisionTracker(tmp_path).compare_versions(1, 2)
+
+    assert diff.additions == ["A new paragraph added in the revision."]
+    assert diff.deletions == []
+
+
+def test_migrated_project_without_texts(tmp_path: Path) -> None:
+    """A project migrated from revision_history.json has no texts to diff."""
+    versions = [
+        {"version_number": number, "version_hash": version_hash, "title": "Title",
+         "timestamp": "2025-01-01T00:00:00"}
+        for number, version_hash in ((1, "a"), (2, "b"))
+    ]
+    (tmp_path / "revision_history.json").write_text(json.dumps({"versions": versions}))
+
+    tracker = RevisionTracker(tmp_path)
+
+    with pytest.raises(ValueError):
+        tracker.compare_versions(1, 2)
+    assert "Changes from Previous Version" not in tracker.get_revision_context()
+    assert "Changes from Version" not in tracker.generate_revision_report()
+    assert not (tmp_path / "diff_cache.json").exists()
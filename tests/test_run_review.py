@@ -0,0 +1,87 @@
+"""Tests for running reviews."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+# The package re-exports the run_review function under the submodule's name
+run_review_module = importlib.import_module("virtual_manuscript_reviewer.run_review")
+
+
+@pytest.fixture
+def fake_arun_review(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replaces the review coroutine with one that only checks it runs on an event loop."""
+    async def arun_review(**kwargs) -> str:
+        await asyncio.sleep(0)
+        return kwargs["manuscript"]
+
+    monkeypatch.setattr(run_review_module, "arun_review", arun_review)
+
+
+def test_run_review_without_event_loop(fake_arun_review: None) -> None:
+    """run_review runs the review coroutine when no event loop is running."""
+    assert run_review_module.run_review("text") == "text"
+
+
+def test_run_review_inside_event_loop(fake_arun_review: None) -> None:
+    """run_review also works from code that already runs an event loop, e.g. Jupyter."""
+    async def main() -> str | None:
+        return run_review_module.run_review("text")
+
+    assert asyncio.run(main()) == "text"
+
+
+@pytest.fixture
+def cancelled_review(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Callable[[], list[str]]:
+    """Returns a function running an individual review that is cancelled after its first turn."""
+    from virtual_manuscript_reviewer.agent import Agent
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    reviewer = Agent(title="Reviewer", expertise="", goal="", role="", model="gpt-4o")
+
+    def run() -> list[str]:
+        turns: list[str] = []
+
+        async def agent_turn(*, agent, **kwargs) -> tuple[str, list, list]:
+            turns.append(agent.title)
+            return "response", [], []
+
+        monkeypatch.setattr(run_review_module, "_agent_turn", agent_turn)
+        with pytest.raises(run_review_module.ReviewCancelled):
+            run_review_module.run_review(
+                "text",
+                review_type="individual",
+                reviewer=reviewer,
+                save_dir=tmp_path,
+                pubmed_search=False,
+                generate_pdf=False,
+                run_mentor=False,
+                should_cancel=lambda: bool(turns),
+            )
+        return turns
+
+    return run
+
+
+def test_run_review_stops_between_stages(cancelled_review: Callable[[], list[str]], tmp_path: Path) -> None:
+    """A review whose should_cancel turns True stops before the next stage and saves nothing."""
+    assert cancelled_review() == ["Reviewer"]
+    assert (tmp_path / "review.jsonl").exists()
+    assert not (tmp_path / "review.json").exists()
+
+
+def test_run_review_keeps_interrupted_log(cancelled_review: Callable[[], list[str]], tmp_path: Path) -> None:
+    """Re-running a review keeps the log of the interrupted run under a timestamped name."""
+    cancelled_review()
+    interrupted_log = (tmp_path / "review.jsonl").read_text()
+
+    cancelled_review()
+    kept_logs = list(tmp_path.glob("review.*.jsonl"))
+    assert len(kept_logs) == 1
+    assert kept_logs[0].read_text() == interrupted_log
+    assert (tmp_path / "review.jsonl").exists()
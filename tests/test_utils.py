@@ -0,0 +1,27 @@
+"""Tests for saving reviews."""
+
+from pathlib import Path
+
+import pytest
+
+from virtual_manuscript_reviewer import utils
+
+DISCUSSION = [
+    {"agent": "User", "message": "Review the manuscript."},
+    {"agent": "Editor", "message": "The α-synuclein data — Fig. 2 — look \"solid\"."},
+]
+
+
+def test_saved_json_does_not_depend_on_orjson(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The standard-library fallback writes the same JSON and log bytes as orjson."""
+    pytest.importorskip("orjson")
+
+    def save(save_dir: Path) -> tuple[bytes, bytes]:
+        utils.save_review(save_dir=save_dir, save_name="review", discussion=DISCUSSION, generate_pdf=False)
+        for turn in DISCUSSION:
+            utils.append_to_discussion_log(save_dir / "review.jsonl", turn)
+        return (save_dir / "review.json").read_bytes(), (save_dir / "review.jsonl").read_bytes()
+
+    with_orjson = save(tmp_path / "orjson")
+    monkeypatch.setattr(utils, "orjson", None)
+    assert save(tmp_path / "json") == with_orjson